@@ -4,49 +4,193 @@ from __future__ import annotations
 
 # ##-- stdlib imports
 import pathlib as pl
-from collections.abc import Iterator
+import time
+import typing
 from importlib import metadata
-from typing import Any, Final, Iterable
 
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
-import bibble
-from jgdv import Maybe
-from sphinx.errors import ExtensionError
+from sphinx.environment import CONFIG_OK
+from sphinx.util.logging import getLogger as getSphinxLogger
 
 # ##-- end 3rd party imports
 
 from . import _interface as API
 from .bib_domain import BibTexDomain
+from .bib_node import VISITORS, as_container, bib_entry
 from .builder import BibDomainHTMLBuilder
 from .parser import BibtexParser
+from .util import BibCache, BibSharder, ReadScheduler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from jgdv import Maybe
 
 __version__ = metadata.version("sphinx_bib_domain")
+sphlog      = getSphinxLogger(__name__)
 ##--|
 
 def bib_collect_pages(app) -> Iterable:
     return []
 
 def bib_page_context(app, page, template, context, doctree) -> Maybe[str]:
-    """ Modify context and use custom templates for bib documents """
-    domain      = app.env.get_domain(API.DOMAIN_NAME)
+    """ With bib_domain_entries_to_context, add the entries of bib documents to the context,
+    and render them with the library template.
+    The library is loaded from the store BibtexParser writes.
+    Only the page's context is changed, so this is safe in parallel writes.
+    """
     bib_doc     = ('page_source_suffix' in context
                    and context['page_source_suffix'] == ".bib")
     bib_context = app.config.bib_domain_entries_to_context
 
     match bib_doc, bib_context:
         case True, True:
-            context['entries'] = doctree.raw_lib.entries
-            return API.TEMPLATES["lib"]
-        case True, False:
+            store = BibCache(pl.Path(app.doctreedir) / API.LIB_STORE_DIR)
+            match store.get(BibCache.digest(page)):
+                case None:
+                    context['entries'] = []
+                case lib:
+                    context['entries'] = lib.entries
             return API.TEMPLATES["lib"]
         case _:
             return None
 
+def bib_add_templates(app, config) -> None:
+    """ Make the html templates of the package available to builders """
+    if str(API.TEMPLATES_DIR) not in config.templates_path:
+        config.templates_path.append(str(API.TEMPLATES_DIR))
+
+def bib_shard_context(app, page, template, context, doctree) -> None:
+    """ Shards are registered at absolute paths,
+    so correct the source suffix and name html derives from the relative path.
+    """
+    if page not in app.env.found_docs or not BibSharder.is_shard(source:=pl.Path(app.env.doc2path(page))):
+        return
+
+    context['page_source_suffix'] = source.suffix
+    if context.get('sourcename'):
+        context['sourcename'] = f"{page}{source.suffix}"
+        if source.suffix != app.config.html_sourcelink_suffix:
+            context['sourcename'] += app.config.html_sourcelink_suffix
+
+def bib_add_shards(app, env, added:set[str], changed:set[str], removed:set[str]) -> list[str]:
+    """ Write the shards of large .bib files beside the doctrees, and add them as documents.
+
+    The source dir is not touched.
+    Shards are kept from removal, and those new or modified since last read are returned.
+    Shards of libraries no longer sharded are removed.
+    """
+    root      = pl.Path(env.doctreedir) / API.SHARD_STORE_DIR
+    sharder   = BibSharder.from_config(app.config)
+    outdated  = []
+    for docname in sorted(env.found_docs):
+        source = pl.Path(env.doc2path(docname))
+        target = BibSharder.shard_dir(root, docname)
+        match source.suffix:
+            case ".bib" if BibSharder.is_shard(source):
+                continue
+            case ".bib" if sharder is not None:
+                shards = sharder.write(source, target)
+            case ".bib":
+                BibSharder.clean(target)
+                continue
+            case _:
+                continue
+
+        for path in shards:
+            shard = path.relative_to(root).with_suffix("").as_posix()
+            if not BibSharder.register(env, shard, path):
+                sphlog.warning("Shard %s of %s conflicts with an existing document", shard, docname)
+                continue
+
+            removed.discard(shard)
+            stale = (env.config_status != CONFIG_OK
+                     or shard not in env.all_docs
+                     or shard in env.reread_always
+                     or not (pl.Path(env.doctreedir) / f"{shard}.doctree").is_file()
+                     or env.all_docs[shard] < path.stat().st_mtime_ns // 1_000)
+            if stale:
+                outdated.append(shard)
+    else:
+        return outdated
+
+def bib_update_indices(app, env) -> list[str]:
+    """ Build the facet index buckets once reading is done,
+    so they are cached in the environment sphinx pickles before writing.
+    """
+    env.get_domain(API.DOMAIN_NAME).update_index_cache()
+    return []
+
+def bib_compact_fallback(app, doctree, docname:str) -> None:
+    """ Builders without bib_entry visitors get plain containers instead """
+    if app.builder.name in VISITORS or app.builder.format in VISITORS:
+        return
+    as_container(doctree)
+
+def bib_skip_unchanged(app, env, docnames:list[str]) -> None:
+    """ Drop .bib documents with unchanged content from the docs to reread.
+
+    Sphinx marks documents outdated by mtime, which checkouts touch.
+    Only documents with an existing doctree, no dependencies,
+    and an unchanged config are dropped.
+    """
+    hashes : dict[str, str] = getattr(env, API.SOURCE_HASHES, {})
+    for docname in [x for x in hashes if x not in env.found_docs]:
+        del hashes[docname]
+
+    for docname in docnames[:]:
+        source = pl.Path(env.doc2path(docname))
+        if source.suffix != ".bib":
+            continue
+        current  = BibCache.digest(source.read_bytes())
+        reusable = (env.config_status == CONFIG_OK
+                    and docname in env.all_docs
+                    and docname not in env.reread_always
+                    and not env.dependencies.get(docname)
+                    and (pl.Path(env.doctreedir) / f"{docname}.doctree").is_file())
+        match hashes.get(docname):
+            case str() as prior if reusable and prior == current:
+                docnames.remove(docname)
+                env.all_docs[docname] = time.time_ns() // 1_000
+            case _:
+                hashes[docname] = current
+    else:
+        setattr(env, API.SOURCE_HASHES, hashes)
+
+def bib_schedule_reads(app, env, docnames:list[str]) -> None:
+    """ Order the docs of a parallel read so the heaviest .bib documents go first.
+
+    .bib documents are weighted by the parse times recorded last build,
+    when all of them have one, and otherwise by source size.
+    """
+    if app.parallel < 2:  # noqa: PLR2004
+        return
+
+    times    = env.get_domain(API.DOMAIN_NAME).data['parse_times']
+    sources  = {x : pl.Path(env.doc2path(x)) for x in docnames}
+    bibs     = [x for x, y in sources.items() if y.suffix == ".bib"]
+    match bibs:
+        case []:
+            return
+        case [*xs] if all(x in times for x in xs):
+            weights = {x : times[x] for x in xs}
+        case [*xs]:
+            weights = {x : float(sources[x].stat().st_size) for x in xs}
+
+    docnames[:] = ReadScheduler(app.parallel).order(docnames, weights)
+
 def setup(app):
-    # app.connect("html-page-context", bib_page_context)
+    app.connect("config-inited", bib_add_templates)
+    app.connect("html-page-context", bib_page_context)
     app.add_domain(BibTexDomain)
+    app.add_node(bib_entry, **VISITORS)
+    app.connect("env-get-outdated", bib_add_shards)
+    app.connect("html-page-context", bib_shard_context, priority=400)
+    app.connect("env-before-read-docs", bib_skip_unchanged)
+    app.connect("env-before-read-docs", bib_schedule_reads)
+    app.connect("env-updated", bib_update_indices)
+    app.connect("doctree-resolved", bib_compact_fallback)
     # For multi-page indices:
     app.add_builder(BibDomainHTMLBuilder)
     # Parse bibtex files:
@@ -59,3 +203,26 @@ def setup(app):
     app.add_config_value("bib_domain_split_index", True, "html", bool)
     app.add_config_value("bib_domain_entries_to_context", False, "html", bool)
     app.add_config_value("bib_domain_templates", API.TEMPLATES_DIR, pl.Path)
+    # build entry nodes directly, instead of rendering and parsing entry.rst.jinja:
+    app.add_config_value("bib_domain_direct", False, "env", bool)
+    # skip the empty index node, object-description-transform, and doc field processing of entries:
+    app.add_config_value("bib_domain_lean", False, "env", bool)
+    # build each entry as one bib_entry node, instead of an index/desc/transition tree:
+    app.add_config_value("bib_domain_compact", False, "env", bool)
+    # read .bib files with more than chunk_size entries in a pool of processes:
+    app.add_config_value("bib_domain_parse_workers", 0, "", int)
+    app.add_config_value("bib_domain_parse_chunk_size", 1000, "", int)
+    # split libraries of more than shard_min entries into documents by 'letter', 'year', or entry count:
+    app.add_config_value("bib_domain_shard_by", None, "env", (str, int))
+    app.add_config_value("bib_domain_shard_min", 1000, "env", int)
+    # cache generated rst between builds, keyed by content hash.
+    # cache_dir is relative to the source dir, defaulting to beside the doctrees:
+    app.add_config_value("bib_domain_cache", True, "env", bool)
+    app.add_config_value("bib_domain_cache_dir", None, "env", (str, pl.Path))
+
+    return {
+        "version"             : __version__,
+        "env_version"         : BibTexDomain.data_version,
+        "parallel_read_safe"  : True,
+        "parallel_write_safe" : True,
+    }
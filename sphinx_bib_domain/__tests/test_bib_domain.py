@@ -11,6 +11,8 @@ from __future__ import annotations
 # ##-- stdlib imports
 import logging as logmod
 import pathlib as pl
+import pickle
+import types
 import warnings
 # ##-- end stdlib imports
 
@@ -20,6 +22,7 @@ import pytest
 
 
 ##--|
+from .. import _interface as API
 from ..bib_domain import BibTexDomain
 ##--|
 
@@ -57,11 +60,167 @@ logging = logmod.getLogger(__name__)
 # Vars:
 
 # Body:
+
+@pytest.fixture
+def env():
+    return types.SimpleNamespace(domaindata={}, docname="doc_a")
+
+def _add(domain, docname, sig, authors=(), tags=()):
+    domain.env.docname = docname
+    domain.add_entry(sig)
+    domain.link_authors(list(authors))
+    domain.link_tags(list(tags))
+
 class TestBibDomain:
 
     def test_sanity(self):
         assert(True is not False) # noqa: PLR0133
 
+    def test_basic(self, env):
+        domain = BibTexDomain(env)
+        assert(isinstance(domain, BibTexDomain))
+        assert(not bool(domain.data['entries']))
+
+    def test_entry_record(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first")
+        record = domain.data['entries']['first']
+        assert(record.key == "first")
+        assert(record.docname == "doc_a")
+        assert(list(domain.get_objects()) == [("bibtex.first", "first", "entry", "doc_a", "bibtex-first", 1)])
+
+    def test_entry_record_pickle(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first")
+        _add(domain, "doc_a", "second")
+        loaded = pickle.loads(pickle.dumps(domain.data['entries']))
+        assert(loaded == domain.data['entries'])
+        assert(loaded['first'].docname is loaded['second'].docname)
+
+    def test_clear_doc(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob"], tags=["a"])
+        _add(domain, "doc_b", "second", authors=["bob", "bill"])
+        domain.clear_doc("doc_a")
+        assert("first" not in domain.data['entries'])
+        assert("second" in domain.data['entries'])
+        assert(list(domain.data['authors']['bob']) == ["second"])
+        assert("a" not in domain.data['tags'])
+
+    def test_links_deduplicated(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob", "bob"])
+        domain.link_authors(["bob"])
+        assert(list(domain.data['authors']['bob']) == ["first"])
+
+    def test_letter_buckets(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob", "alice", "bill"])
+        _add(domain, "doc_b", "second", authors=["amy"])
+        assert(domain.data['letters']['authors'] == {"A": ["alice", "amy"], "B": ["bill", "bob"]})
+        domain.clear_doc("doc_b")
+        assert(domain.data['letters']['authors'] == {"A": ["alice"], "B": ["bill", "bob"]})
+        domain.clear_doc("doc_a")
+        assert(domain.data['letters']['authors'] == {})
+
+    def test_links_sorted(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "zzz", authors=["bob"])
+        _add(domain, "doc_a", "aaa", authors=["bob"])
+        _add(domain, "doc_a", "mmm", authors=["bob"])
+        assert(list(domain.data['authors']['bob']) == ["aaa", "mmm", "zzz"])
+
+    def test_link_year(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first")
+        domain.link_year("1850")
+        _add(domain, "doc_b", "second")
+        domain.link_year("c. 1850")
+        domain.link_year("unknown")
+        assert(list(domain.data['years'][1850]) == ["first", "second"])
+        assert(len(domain.data['years']) == 1)
+        domain.clear_doc("doc_b")
+        assert(list(domain.data['years'][1850]) == ["first"])
+
+    def test_link_data_skips_empty(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first")
+        domain.link_data("years", [0, "", None])
+        domain.link_data("tags", ["", "a"])
+        assert(list(domain.data['years']) == [0])
+        assert(list(domain.data['tags']) == ["a"])
+
+    def test_reverse_index(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob"], tags=["a"])
+        _add(domain, "doc_b", "second", authors=["bill"])
+        record = domain.data['docs']['doc_a']
+        assert(record['entries'] == {"first"})
+        assert(record['links'] == {("authors", "bob"): {"first"}, ("tags", "a"): {"first"}})
+        domain.clear_doc("doc_a")
+        assert("doc_a" not in domain.data['docs'])
+        assert("doc_b" in domain.data['docs'])
+
+    @pytest.mark.parametrize("count", [100, 200])
+    def test_clear_doc_linear(self, env, mocker, count):
+        """ Each link only discards the document's own entries from its bucket """
+        domain = BibTexDomain(env)
+        for i in range(count):
+            _add(domain, "doc_a", f"entry_{i:03}", authors=[f"author_{i:03}"], tags=["shared"])
+        _add(domain, "doc_b", "other", tags=["shared"])
+        spy    = mocker.spy(API.LinkSet, "discard")
+        domain.clear_doc("doc_a")
+        assert(spy.call_count == 2 * count)
+        assert(list(domain.data['tags']['shared']) == ["other"])
+        assert(not domain.data['authors'])
+
+    def test_clear_doc_missing(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob"])
+        domain.clear_doc("doc_c")
+        assert("first" in domain.data['entries'])
+
+    def test_merge_domaindata(self, env):
+        domain = BibTexDomain(env)
+        _add(domain, "doc_a", "first", authors=["bob"])
+        other  = BibTexDomain(types.SimpleNamespace(domaindata={}, docname="doc_b"))
+        _add(other, "doc_b", "second", authors=["bob"], tags=["b"])
+        _add(other, "doc_c", "third", authors=["bill"])
+        domain.merge_domaindata({"doc_b"}, other.data)
+        assert("second" in domain.data['entries'])
+        assert("third" not in domain.data['entries'])
+        assert(list(domain.data['authors']['bob']) == ["first", "second"])
+        assert(list(domain.data['tags']['b']) == ["second"])
+        assert("bill" not in domain.data['authors'])
+
+    def test_merge_order_independent(self, env):
+        workers = []
+        for doc, sig in [("doc_b", "second"), ("doc_c", "third")]:
+            other = BibTexDomain(types.SimpleNamespace(domaindata={}, docname=doc))
+            _add(other, doc, sig, authors=["bob"])
+            workers.append((doc, other.data))
+
+        forward  = BibTexDomain(types.SimpleNamespace(domaindata={}, docname="doc_a"))
+        backward = BibTexDomain(types.SimpleNamespace(domaindata={}, docname="doc_a"))
+        for doc, data in workers:
+            forward.merge_domaindata({doc}, data)
+        for doc, data in reversed(workers):
+            backward.merge_domaindata({doc}, data)
+
+        assert(sorted(forward.get_objects()) == sorted(backward.get_objects()))
+        assert(sorted(forward.data['authors']['bob']) == sorted(backward.data['authors']['bob']))
+
+    def test_parse_times(self, env):
+        domain = BibTexDomain(env)
+        domain.note_parse_time("doc_a", 0.5)
+        other  = BibTexDomain(types.SimpleNamespace(domaindata={}, docname="doc_b"))
+        other.note_parse_time("doc_b", 1.5)
+        other.note_parse_time("doc_c", 2.5)
+        domain.merge_domaindata({"doc_b"}, other.data)
+        assert(domain.data['parse_times'] == {"doc_a": 0.5, "doc_b": 1.5})
+        domain.clear_doc("doc_a")
+        assert(domain.data['parse_times'] == {"doc_b": 1.5})
+
     ##--|
     @pytest.mark.skip
     def test_todo(self):
@@ -8,23 +8,13 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
 import pathlib as pl
 import re
-import time
+import sys
+from bisect import bisect_left, insort
 import types
 import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 # ##-- types
@@ -60,11 +50,18 @@ logging = logmod.getLogger(__name__)
 
 # Vars:
 DOMAIN_NAME    : Final[str]             = "bibtex"
+ENTRY_OBJ_TYPE : Final[str]             = "entry"
 TEMPLATES_DIR  : Final[pl.Path]         = pl.Path(__file__).parent / "_templates"
 TEMPLATES      : Final[dict[str, str]]  = {
     "lib"      : "bib_domain/lib.html.jinja",
     "entry"    : "bib_domain/entry.html.jinja",
 }
+ENTRY_START_RE   : Final[re.Pattern]  = re.compile(r"^@", re.MULTILINE)
+SHARD_DIR_SUFFIX : Final[str]         = "_shards"
+SHARD_STORE_DIR  : Final[str]         = "bib_shards"
+LIB_STORE_DIR    : Final[str]         = "bib_libs"
+# env attribute of docname -> content hash of .bib sources:
+SOURCE_HASHES    : Final[str]         = "bib_domain_source_hashes"
 # Body:
 
 def anchor(sig:str) -> str:
@@ -72,3 +69,117 @@ def anchor(sig:str) -> str:
 
 def fsig(sig:str) -> str:
     return f"{DOMAIN_NAME}.{sig}"
+
+def index_bucket(key:str|int) -> str|int:
+    """ The bucket a key is indexed under.
+    The upper case first letter of strings, or the decade of years.
+    """
+    match key:
+        case int():
+            return key - (key % 10)
+        case _:
+            return key[0].upper()
+
+##--|
+
+class EntryRecord:
+    """ A compact record of an entry registered in the bibtex domain.
+
+    Stores the bare key and an interned docname,
+    the rest of the sphinx object description is derived on demand.
+    """
+    __slots__ = ("docname", "key")
+    key     : str
+    docname : str
+
+    def __init__(self, key:str, docname:str) -> None:
+        self.key      = key
+        self.docname  = sys.intern(docname)
+
+    def __reduce__(self) -> tuple:
+        return (EntryRecord, (self.key, self.docname))
+
+    def __eq__(self, other:object) -> bool:
+        match other:
+            case EntryRecord():
+                return (self.key, self.docname) == (other.key, other.docname)
+            case _:
+                return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.docname))
+
+    def __repr__(self) -> str:
+        return f"<EntryRecord: {self.key} ({self.docname})>"
+
+    @property
+    def name(self) -> str:
+        return fsig(self.key)
+
+    @property
+    def anchor(self) -> str:
+        return anchor(self.key)
+
+    def to_object(self) -> tuple[str, str, str, str, str, int]:
+        """ The (name, dispname, type, docname, anchor, priority) tuple sphinx expects """
+        return (self.name, self.key, ENTRY_OBJ_TYPE, self.docname, self.anchor, 1)
+
+class LinkSet:
+    """ A deduplicated, sorted set of entry keys linked to a tag/author etc.
+
+    Membership is O(1), and the keys are kept in sorted order as they are added,
+    so indices can walk them without sorting.
+    """
+    __slots__ = ("_members", "_order")
+    _members : set[str]
+    _order   : list[str]
+
+    def __init__(self, keys:Iterable[str]=()) -> None:
+        self._members  = set()
+        self._order    = []
+        self.update(keys)
+
+    def __reduce__(self) -> tuple:
+        return (LinkSet, (self._order,))
+
+    def __contains__(self, key:object) -> bool:
+        return key in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __eq__(self, other:object) -> bool:
+        match other:
+            case LinkSet():
+                return self._order == other._order
+            case _:
+                return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<LinkSet: {self._order}>"
+
+    def add(self, key:str) -> bool:
+        """ Add a key, returning False if it was already present """
+        if key in self._members:
+            return False
+
+        self._members.add(key)
+        if not bool(self._order) or self._order[-1] < key:
+            self._order.append(key)
+        else:
+            insort(self._order, key)
+        return True
+
+    def update(self, keys:Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key:str) -> None:
+        if key not in self._members:
+            return
+
+        self._members.discard(key)
+        del self._order[bisect_left(self._order, key)]
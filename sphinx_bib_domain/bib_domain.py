@@ -7,20 +7,10 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
 import re
-import time
 import types
-import weakref
-from collections import defaultdict
-from sys import stderr
-from urllib.parse import urlparse
-from uuid import UUID, uuid1
+from bisect import bisect_left, insort
 
 # ##-- end stdlib imports
 
@@ -37,7 +27,7 @@ from sphinx.util.nodes import make_refnode
 
 from sphinx.util.logging import getLogger as getSphinxLogger
 from . import _interface as API
-from .directives import BibEntryDirective
+from .directives import BibEntryDirective, BibLibraryDirective
 from . import roles, indices
 
 # ##-- types
@@ -59,6 +49,7 @@ if TYPE_CHECKING:
     from typing import TypeGuard
     from collections.abc import Iterable, Iterator, Callable, Generator
     from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+    from collections.abc import Set
 
     from docutils import nodes
     from docutils.nodes import Element, Node
@@ -82,18 +73,26 @@ logging = logmod.getLogger(__name__)
 sphlog = getSphinxLogger(__name__)
 ##-- end logging
 
+# Vars:
+YEAR_RE : Final[re.Pattern] = re.compile(r"\d{1,4}")
+
 class BibTexDomain(Domain):
     """ Custom Domain for sphixn
     register with app.add_domain(StandardDomain)
     """
     name                  : str                                = API.DOMAIN_NAME
     label                 : str                                = API.DOMAIN_NAME
-    data_version          : int                                = 0
+    data_version          : int                                = 9
     # directives, roles, indices to be registered rather than in setup:
     directives            : dict[str,type[Directive]]
     roles                 : dict[str, Role]
     indices               : list[type[Index]]
     _last_signature       : Maybe[str]
+    _facet_content        : Maybe[dict[str, list]]
+    _facet_docnames       : Maybe[frozenset[str]]
+    object_types          : ClassVar[dict[str, ObjType]] = {
+        API.ENTRY_OBJ_TYPE : ObjType(API.ENTRY_OBJ_TYPE, "entry", "ref"),
+    }
     # initial data to copy to env.domaindata[domain_name]
     _virtual_names        : dict[str, tuple[str, str]]
     ##--|
@@ -108,24 +107,51 @@ class BibTexDomain(Domain):
                                                     indices.PublisherIndex,
                                                     indices.JournalIndex,
                                                     indices.InstitutionIndex,
-                                                    indices.SeriesIndex]
+                                                    indices.SeriesIndex,
+                                                    indices.YearIndex]
+    # Link tables are {key : API.LinkSet}, ie: sorted sets of entry keys.
     initial_data : ClassVar[dict[str, dict]] = {
+        # key -> API.EntryRecord
         'entries'       : {},
-        'tags'          : defaultdict(list),
-        'authors'       : defaultdict(list),
-        'publishers'    : defaultdict(list),
-        'journals'      : defaultdict(list),
-        'institutions'  : defaultdict(list),
-        'series'        : defaultdict(list),
+        'tags'          : {},
+        'authors'       : {},
+        'publishers'    : {},
+        'journals'      : {},
+        'institutions'  : {},
+        'series'        : {},
+        # year -> API.LinkSet
+        'years'         : {},
+        # docname -> {'entries': set[sig], 'links': {(table, key) : set[sig]}}
+        'docs'          : {},
+        # table -> bucket -> sorted list of keys, maintained on link/unlink.
+        # see API.index_bucket
+        'letters'       : {
+            'tags'          : {},
+            'authors'       : {},
+            'publishers'    : {},
+            'journals'      : {},
+            'institutions'  : {},
+            'series'        : {},
+            'years'         : {},
+        },
+        # facet -> bucket -> list[IndexEntry], see indices.FacetIndexEngine
+        'index_cache'   : {},
+        # facet -> set[bucket] that need rebuilding
+        'index_dirty'   : {},
+        # docname -> seconds its last parse took, see BibtexParser.parse
+        'parse_times'   : {},
     }
 
     def __init__(self, env:BuildEnvironment) -> None:
         super().__init__(env)
 
         self._last_signature = None
+        self._facet_content  = None
+        self._facet_docnames = None
 
         # directives, roles, indices to be registered rather than in setup:
-        self.directives   = {'entry'        : BibEntryDirective}
+        self.directives   = {'entry'        : BibEntryDirective,
+                             'library'      : BibLibraryDirective}
         self.indices        = BibTexDomain._new_indices[:]
         self.roles        = {'ref'          : XRefRole()}
         self.roles.update({x.reftype : x() for x in BibTexDomain._new_roles})
@@ -140,9 +166,65 @@ class BibTexDomain(Domain):
     def get_full_qualified_name(self, node) -> str:
         return cast("str", API.fsig(node.arguments[0]))
 
+    @override
+    def clear_doc(self, docname:str) -> None:
+        """ Remove the entries, and their links, that docname contributed.
+        Uses the docname reverse index, so only that document's links,
+        and only its own entry keys in each, are visited.
+        """
+        self.data['parse_times'].pop(docname, None)
+        record = self.data['docs'].pop(docname, None)
+        if record is None:
+            return
+
+        self._facet_content = None
+        entries = self.data['entries']
+        removed = record['entries']
+        for sig in removed:
+            if sig in entries and entries[sig].docname == docname:
+                del entries[sig]
+
+        for (table, key), own in record['links'].items():
+            self._mark_dirty(table, key)
+            data = self.data[table]
+            if key not in data:
+                continue
+            sigs = data[key]
+            for sig in own:
+                sigs.discard(sig)
+            if not bool(sigs):
+                self._unlink_key(table, key)
+
+    @override
+    def merge_domaindata(self, docnames:Set[str], otherdata:dict) -> None:
+        """ Merge the data of a parallel read worker.
+        Only entries from docnames are taken,
+        and they are merged in sorted order so the result doesn't depend on
+        which worker finished first.
+        """
+        self._facet_content = None
+        other_entries = otherdata['entries']
+        other_docs    = otherdata['docs']
+        for docname in sorted(docnames):
+            if docname in otherdata['parse_times']:
+                self.data['parse_times'][docname] = otherdata['parse_times'][docname]
+            if docname not in other_docs:
+                continue
+            record = other_docs[docname]
+            merged = record['entries']
+            self.data['docs'][docname] = record
+            for sig in sorted(merged):
+                if sig in other_entries:
+                    self.data['entries'][sig] = other_entries[sig]
+
+            for (table, key), own in sorted(record['links'].items()):
+                for sig in sorted(own):
+                    self._link(table, key, sig)
+
     @override
     def get_objects(self) -> Iterator[tuple[str, str, str, str, str, int]]:
-        yield from self.data['entries'].values()
+        for record in self.data['entries'].values():
+            yield record.to_object()
 
     @override
     def resolve_xref(self, env:BuildEnvironment, fromdocname:str, builder:Builder, typ:str, target:str, node:pending_xref, contnode:Element):
@@ -155,13 +237,15 @@ class BibTexDomain(Domain):
         cap_target   = "cap-{}".format(target[0].upper())
         match typ:
             case "entry" | "ref":
-                 entry = self.data['entries'][API.fsig(target)]
+                 if (entry:=self.data['entries'].get(target, None)) is None:
+                     logging.debug("Failed to find entry: %s", target)
+                     return None
                  return make_refnode(builder,
                                      fromdocname,
-                                     entry[2],
-                                     entry[3],
+                                     entry.docname,
+                                     entry.anchor,
                                      contnode,
-                                     entry[3],
+                                     entry.anchor,
                                      )
             case "tag":
                 data_key = "tags"
@@ -194,31 +278,84 @@ class BibTexDomain(Domain):
         target_text = f":~:text={target}"
         return make_refnode(builder, fromdocname, todocname, target_text, contnode, target_text)
 
+    def facet_index_content(self, facet:str, *, docnames:Maybe[Iterable[str]]=None) -> list:
+        """ Get the index content of a facet (eg: 'authors').
+        All facets are built together on first request, and cached until the data changes.
+        With docnames, only entries from those documents are included.
+        """
+        requested = None if docnames is None else frozenset(docnames)
+        if self._facet_content is None or requested != self._facet_docnames:
+            facets = [x for x in self.indices if issubclass(x, indices.FacetIndex)]
+            self._facet_content  = indices.FacetIndexEngine(self.data, facets).build(docnames=requested)
+            self._facet_docnames = requested
+
+        return self._facet_content[facet]
+
+    def update_index_cache(self) -> None:
+        """ Rebuild the stale buckets of data['index_cache'].
+        Called on env-updated, before the environment is pickled, so built buckets persist.
+        """
+        facets               = [x for x in self.indices if issubclass(x, indices.FacetIndex)]
+        self._facet_content  = indices.FacetIndexEngine(self.data, facets).build()
+        self._facet_docnames = None
+
     def add_entry(self, signature):
         """Add a new entry to the domain."""
-        self._last_signature = API.fsig(signature)
-        anchor_s             = API.anchor(signature)
-        # name, dispname, type, docname, API.anchor, priority
-        self.data['entries'][self._last_signature] = (
-            self._last_signature,
-            signature,
-            self.env.docname,
-            anchor_s,
-            '',
-            1,
-            )
-
-    def link_data(self, target:str, data:list[str]) -> None:
+        self._last_signature = signature
+        self._facet_content  = None
+        self._doc_record()['entries'].add(signature)
+        self.data['entries'][signature] = API.EntryRecord(signature, self.env.docname)
+
+    def note_parse_time(self, docname:str, seconds:float) -> None:
+        self.data['parse_times'][docname] = seconds
+
+    def link_data(self, target:str, data:list[str|int]) -> None:
         if not self._last_signature:
             logging.debug("Tried to link data without a signature")
             return
 
         assert(target in self.data)
-        sig_s = self._last_signature
+        sig_s  = self._last_signature
+        links  = self._doc_record()['links']
         for val in data:
-            if not bool(val):
+            if val is None or val == "":
                 continue
-            self.data[target][val].append(sig_s)
+            self._link(target, val, sig_s)
+            links.setdefault((target, val), set()).add(sig_s)
+
+    def _link(self, table:str, key:str|int, sig:str) -> None:
+        """ Add sig to table[key], creating the key and its letter bucket entry if necessary """
+        self._mark_dirty(table, key)
+        data = self.data[table]
+        if key not in data:
+            data[key] = API.LinkSet()
+            if table in self.data['letters']:
+                bucket = self.data['letters'][table].setdefault(API.index_bucket(key), [])
+                insort(bucket, key)
+
+        data[key].add(sig)
+
+    def _unlink_key(self, table:str, key:str|int) -> None:
+        """ Remove a key from a table, and from its letter bucket """
+        del self.data[table][key]
+        if table not in self.data['letters']:
+            return
+
+        letter  = API.index_bucket(key)
+        buckets = self.data['letters'][table]
+        bucket  = buckets[letter]
+        del bucket[bisect_left(bucket, key)]
+        if not bool(bucket):
+            del buckets[letter]
+
+    def _mark_dirty(self, table:str, key:str|int) -> None:
+        """ Mark the index bucket of a key as needing to be rebuilt """
+        self._facet_content = None
+        self.data['index_dirty'].setdefault(table, set()).add(API.index_bucket(key))
+
+    def _doc_record(self) -> dict:
+        """ Get the reverse index record of the current document """
+        return self.data['docs'].setdefault(self.env.docname, {'entries': set(), 'links': {}})
 
     def link_tags(self, tags:list[str]):
         self.link_data("tags", tags)
@@ -237,3 +374,11 @@ class BibTexDomain(Domain):
 
     def link_series(self, series:str):
         self.link_data("series", [series.strip()])
+
+    def link_year(self, year:str):
+        """ Link the current entry to the integer year found in the year string """
+        match YEAR_RE.search(year):
+            case None:
+                logging.debug("Unrecognised year: %s", year)
+            case x:
+                self.link_data("years", [int(x[0])])
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+A compact doctree node for bibtex entries, and its visitors.
+
+"""
+# ruff: noqa: N801
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+# ##-- end stdlib imports
+
+from docutils import nodes # type: ignore[import-untyped]
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+    from sphinx.writers.html5 import HTML5Translator
+    from sphinx.writers.latex import LaTeXTranslator
+    from sphinx.writers.manpage import ManualPageTranslator
+    from sphinx.writers.texinfo import TexinfoTranslator
+    from sphinx.writers.text import TextTranslator
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+CR : Final[str] = "\n"
+# Body:
+
+class bib_entry(nodes.General, nodes.Element):
+    """ A bibtex entry, in place of an index/desc/transition tree.
+
+    The entry key and title are attributes, and 'ids' holds the same anchors
+    a desc_signature would. The children are a title paragraph,
+    and the line_block of the entry's details.
+    """
+
+def visit_bib_entry_html(self:HTML5Translator, node:bib_entry) -> None:
+    self.body.append(self.starttag(node, "div", CLASS="bibtex entry"))
+
+def depart_bib_entry_html(self:HTML5Translator, node:bib_entry) -> None:
+    self.body.append(f"</div>{CR}")
+
+def visit_bib_entry_latex(self:LaTeXTranslator, node:bib_entry) -> None:
+    self.body.append(CR + self.hypertarget_to(node, anchor=True) + CR)
+
+def depart_bib_entry_latex(self:LaTeXTranslator, node:bib_entry) -> None:
+    self.body.append(CR)
+
+def visit_bib_entry_text(self:TextTranslator, node:bib_entry) -> None:
+    pass
+
+def depart_bib_entry_text(self:TextTranslator, node:bib_entry) -> None:
+    pass
+
+def visit_bib_entry_man(self:ManualPageTranslator, node:bib_entry) -> None:
+    pass
+
+def depart_bib_entry_man(self:ManualPageTranslator, node:bib_entry) -> None:
+    pass
+
+def visit_bib_entry_texinfo(self:TexinfoTranslator, node:bib_entry) -> None:
+    for x in node['ids']:
+        self.add_anchor(x, node)
+
+def depart_bib_entry_texinfo(self:TexinfoTranslator, node:bib_entry) -> None:
+    pass
+
+def as_container(doctree:nodes.document) -> None:
+    """ Replace each bib_entry with a container holding its ids and children,
+    for builders without bib_entry visitors.
+    """
+    for node in list(doctree.findall(bib_entry)):
+        node.replace_self(nodes.container('', *node.children, ids=node['ids'], classes=["bibtex", "entry"]))
+
+VISITORS : Final[dict[str, tuple[Callable, Callable]]] = {
+    "html"    : (visit_bib_entry_html, depart_bib_entry_html),
+    "latex"   : (visit_bib_entry_latex, depart_bib_entry_latex),
+    "text"    : (visit_bib_entry_text, depart_bib_entry_text),
+    "man"     : (visit_bib_entry_man, depart_bib_entry_man),
+    "texinfo" : (visit_bib_entry_texinfo, depart_bib_entry_texinfo),
+}
@@ -16,11 +16,13 @@ import warnings
 
 # ##-- 3rd party imports
 import pytest
+from sphinx.testing.util import SphinxTestApp
 # ##-- end 3rd party imports
 
 
 ##--|
 from .. import BibDomainHTMLBuilder
+from ..bib_html_builder import INDEX_HASHES_FILE, PARALLEL_PAGE_MIN
 ##--|
 
 # ##-- types
@@ -56,13 +58,85 @@ logging = logmod.getLogger(__name__)
 ##-- end logging
 
 # Vars:
-
+# The split index templates of the package's docs:
+DOC_TEMPLATES : Final[pl.Path] = pl.Path(__file__).parent.parent.parent / "_docs" / "_templates"
+# One author, and so one index subpage, per letter:
+BIB : Final[str] = "\n".join(f"@book{{key_{x},\n  title = {{Book {x}}},\n  author = {{{x}son, Ann}},\n  year = {{2001}},\n}}"
+                              for x in "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 # Body:
+
+def _build_outputs(srcdir:pl.Path, parallel:int) -> tuple[dict[str, bytes], str]:
+    (srcdir / "_templates").mkdir(parents=True)
+    for name in ["domainindex-split.html", "domainindex-single.html"]:
+        (srcdir / "_templates" / name).write_bytes((DOC_TEMPLATES / name).read_bytes())
+    (srcdir / "conf.py").write_text('extensions = ["sphinx_bib_domain"]\nroot_doc = "lib"\nprimary_domain = "bibtex"\n'
+                                    'templates_path = ["_templates"]\n')
+    (srcdir / "lib.bib").write_text(BIB)
+    app = SphinxTestApp("bibhtml", srcdir=srcdir, parallel=parallel)
+    try:
+        app.build()
+        outdir = pl.Path(app.outdir)
+        files  = {x.relative_to(outdir).as_posix() : x.read_bytes() for x in outdir.rglob("*") if x.is_file()}
+        return files, app.status.getvalue()
+    finally:
+        app.cleanup()
+@pytest.fixture
+def builder(tmp_path):
+    obj = BibDomainHTMLBuilder.__new__(BibDomainHTMLBuilder)
+    obj.outdir               = tmp_path
+    obj._site_hash           = "site"
+    obj._prior_page_hashes   = {}
+    obj._page_hashes         = {}
+    obj.get_outfilename      = lambda x: tmp_path / f"{x}.html"
+    return obj
+
 class TestBibHtmlBuilder:
 
     def test_sanity(self):
         assert(True is not False)
 
+    def test_page_changed_without_prior(self, builder):
+        assert(not builder._page_unchanged("index-A", "part.html", {"entries": [1, 2]}))
+        assert("index-A" in builder._page_hashes)
+
+    def test_page_unchanged(self, builder, tmp_path):
+        builder._page_unchanged("index-A", "part.html", {"entries": [1, 2]})
+        builder._prior_page_hashes = builder._page_hashes
+        builder._page_hashes       = {}
+        (tmp_path / "index-A.html").write_text("blah")
+        assert(builder._page_unchanged("index-A", "part.html", {"entries": [1, 2]}))
+        assert(not builder._page_unchanged("index-A", "part.html", {"entries": [1, 3]}))
+
+    def test_page_missing_output(self, builder):
+        builder._page_unchanged("index-A", "part.html", {"entries": [1, 2]})
+        builder._prior_page_hashes = builder._page_hashes
+        assert(not builder._page_unchanged("index-A", "part.html", {"entries": [1, 2]}))
+
+    def test_site_signature_templates(self, builder, mocker):
+        builder.build_info = mocker.Mock(config_hash="config", tags_hash="tags")
+        builder.env        = mocker.Mock(toctree_includes={}, titles={})
+        builder.templates  = mocker.Mock()
+        builder.templates.newest_template_mtime.return_value = 1.0
+        first = builder._site_signature()
+        assert(builder._site_signature() == first)
+        builder.templates.newest_template_mtime.return_value = 2.0
+        assert(builder._site_signature() != first)
+
+    def test_page_hashes_roundtrip(self, builder):
+        builder._page_hashes = {"index-A": "abcd"}
+        builder._save_page_hashes()
+        assert(builder._load_page_hashes() == {"index-A": "abcd"})
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """ Index subpages written in worker processes are identical to a serial build's """
+        serial, _         = _build_outputs(tmp_path / "serial", 1)
+        parallel, status  = _build_outputs(tmp_path / "parallel", 2)
+        assert(PARALLEL_PAGE_MIN < len([x for x in serial if x.startswith("bibtex-author-index-")]))
+        assert("domain index pages in parallel" in status)
+        assert(serial.keys() == parallel.keys())
+        # The page hashes include template mtimes, which differ between the two projects:
+        assert([x for x in serial if serial[x] != parallel[x] and x != INDEX_HASHES_FILE] == [])
+
     ##--|
     @pytest.mark.skip
     def test_todo(self):
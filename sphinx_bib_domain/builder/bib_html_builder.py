@@ -8,29 +8,19 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
 import pathlib as pl
-import re
-import time
 import types
 import collections
-import contextlib
 import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 import jinja2.exceptions
+import json
 import os
 import html
 from sphinx.util.osutil import relative_uri
+from sphinx.util.parallel import ParallelTasks, make_chunks, parallel_available
 from sphinx.builders.html import StandaloneHTMLBuilder
 from sphinx.builders.html._assets import _JavaScript, _CascadingStyleSheet, _file_checksum
 from sphinx.errors import ConfigError, ThemeError
@@ -69,6 +59,8 @@ sphlog = getSphinxLogger(__name__)
 ##-- end logging
 
 # Vars:
+INDEX_HASHES_FILE : Final[str] = ".bib_index_hashes.json"
+PARALLEL_PAGE_MIN : Final[int] = 20
 
 # Body:
 
@@ -80,10 +72,18 @@ class BibDomainHTMLBuilder(StandaloneHTMLBuilder):
     """
 
     name = "bibhtml"
+    _prior_page_hashes : dict[str, str]
+    _page_hashes       : dict[str, str]
+    _site_hash         : str
+    _queued_pages      : list[tuple[str, dict, str]]
 
     ##--| index writers
 
     def write_domain_indices(self) -> None:
+        self._prior_page_hashes  = self._load_page_hashes()
+        self._page_hashes        = {}
+        self._site_hash          = self._site_signature()
+        self._queued_pages       = []
         for index_name, index_cls, content, collapse in self.domain_indices:
             index_context = {
                 'indextitle'     : index_cls.localname,
@@ -97,6 +97,9 @@ class BibDomainHTMLBuilder(StandaloneHTMLBuilder):
             else:
                 sphlog.info("Domain Index: %s", index_name)
                 self.handle_page(index_name, index_context, "domainindex.html")
+        else:
+            self._write_queued_pages()
+            self._save_page_hashes()
 
     def _split_domain_into_subpages(self, name:str, context:dict, template_overview:str, template_part:str) -> None:
         """ Adapted from sphinx's write_genidex """
@@ -116,6 +119,80 @@ class BibDomainHTMLBuilder(StandaloneHTMLBuilder):
                 'entries'          : entries,
                 'genindexentries'  : [],
             }
-            self.handle_page(f"{name}-{key}", ctx, template_part)
+            pagename = f"{name}-{key}"
+            if self._page_unchanged(pagename, template_part, ctx):
+                continue
+            self._queued_pages.append((pagename, ctx, template_part))
         else:
             self.handle_page(name, context, template_overview)
+
+    def _write_queued_pages(self) -> None:
+        """ Render the queued index subpages.
+        With -j, and enough pages to be worth it, they are rendered in worker processes
+        using the same handle_page call as the serial path.
+
+        html-page-context handlers then run in the workers,
+        as they do for documents in sphinx's parallel write.
+        So they may change the context of the page being rendered,
+        but other changes they make are not merged back into the main process.
+        """
+        pages  = self._queued_pages
+        nproc  = self.app.parallel
+        self._queued_pages = []
+        if not (parallel_available and self.parallel_ok and nproc > 1 and PARALLEL_PAGE_MIN < len(pages)):
+            for pagename, ctx, template in pages:
+                self.handle_page(pagename, ctx, template)
+            return
+
+        def write_process(chunk:list[tuple[str, dict, str]]) -> None:
+            for pagename, ctx, template in chunk:
+                self.handle_page(pagename, ctx, template)
+
+        sphlog.info("Writing %s domain index pages in parallel", len(pages))
+        tasks = ParallelTasks(nproc)
+        for chunk in make_chunks(pages, nproc):
+            tasks.add_task(write_process, chunk)
+        else:
+            tasks.join()
+
+    ##--| page memoization
+
+    def _page_unchanged(self, pagename:str, template:str, ctx:dict) -> bool:
+        """ Record the content hash of a page,
+        and check whether it matches the previous build's already written page.
+        """
+        content = repr((self._site_hash, template, sorted(ctx.items()))).encode()
+        digest  = hashlib.sha256(content).hexdigest()
+        self._page_hashes[pagename] = digest
+        if self._prior_page_hashes.get(pagename, None) != digest:
+            return False
+
+        return pl.Path(self.get_outfilename(pagename)).exists()
+
+    def _site_signature(self) -> str:
+        """ Hash the parts of the build that every page depends on:
+        the config, tags, templates, and the toctree structure and titles used for navigation.
+        """
+        env      = self.env
+        parts    = [
+            self.build_info.config_hash,
+            self.build_info.tags_hash,
+            self.templates.newest_template_mtime(),
+            sorted(env.toctree_includes.items()),
+            sorted((x, y.astext()) for x, y in env.titles.items()),
+        ]
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _load_page_hashes(self) -> dict[str, str]:
+        path = pl.Path(self.outdir) / INDEX_HASHES_FILE
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            logging.info("Could not load index page hashes: %s", path)
+            return {}
+
+    def _save_page_hashes(self) -> None:
+        path = pl.Path(self.outdir) / INDEX_HASHES_FILE
+        path.write_text(json.dumps(self._page_hashes, sort_keys=True))
@@ -3,3 +3,6 @@
 """
 
 from .bib_entry import BibEntryDirective
+from .bib_library import BibLibraryDirective
+from .entry_nodes import EntryNodeBuilder, link_entry
+from .parsed_entry import ParsedEntry
@@ -14,6 +14,10 @@ import pathlib as pl
 import warnings
 # ##-- end stdlib imports
 
+from docutils import nodes
+from sphinx import addnodes
+from sphinx.testing.util import SphinxTestApp
+from ...bib_node import bib_entry
 from .. import BibEntryDirective
 
 # ##-- 3rd party imports
@@ -53,12 +57,106 @@ logging = logmod.getLogger(__name__)
 
 # Vars:
 
+ENTRY : Final[str] = """
+.. bibtex:entry:: a_key
+   :title: An Example Entry
+   :author: Bob | Bill
+   :year: 2025
+   :tags: example,bibtex
+"""
+CROSSREF : Final[str] = """
+.. bibtex:entry:: b_key
+   :title: A Chapter
+   :crossref: a_key
+"""
+# The entry's unqualified roles resolve with bibtex as the default domain:
+PRIMARY : Final[str] = 'primary_domain = "bibtex"\n'
 # Body:
+
+def _build(tmp_path, conf:str="", builder:str="dummy", extra:str=""):
+    (tmp_path / "conf.py").write_text(f'extensions = ["sphinx_bib_domain"]\n{conf}')
+    (tmp_path / "index.rst").write_text(f"Test\n====\n{ENTRY}\n{extra}\nAfter.\n")
+    app = SphinxTestApp(builder, srcdir=tmp_path)
+    try:
+        app.build()
+        return app.env.get_doctree("index"), app.outdir
+    finally:
+        app.cleanup()
+
 class TestBibEntryDirect:
 
     def test_sanity(self):
         assert(True is not False) # noqa: PLR0133
 
+    def test_entry(self, tmp_path):
+        doctree, _ = _build(tmp_path, conf=PRIMARY)
+        assert(len(list(doctree.findall(addnodes.desc))) == 1)
+        assert(len(list(doctree.findall(addnodes.index))) == 1)
+        assert(len(list(doctree.findall(addnodes.pending_xref))) == 4)
+
+    def test_entry_unresolved_roles(self, tmp_path):
+        """ Without bibtex as the default domain, the rst reports the roles """
+        doctree, _ = _build(tmp_path)
+        assert(len(list(doctree.findall(addnodes.desc))) == 1)
+        assert(not list(doctree.findall(addnodes.pending_xref)))
+        assert(len(list(doctree.findall(nodes.problematic))) == 4)
+
+    def test_lean(self, tmp_path):
+        doctree, _ = _build(tmp_path, conf=f"{PRIMARY}bib_domain_lean = True\n")
+        assert(len(list(doctree.findall(addnodes.desc))) == 1)
+        assert(not list(doctree.findall(addnodes.index)))
+        assert(len(list(doctree.findall(addnodes.pending_xref))) == 4)
+
+    def test_compact(self, tmp_path):
+        doctree, _ = _build(tmp_path, conf=f"{PRIMARY}bib_domain_compact = True\n")
+        match list(doctree.findall(bib_entry)):
+            case [node]:
+                assert(node['key'] == "a_key")
+                assert(node['title'] == "An Example Entry")
+                assert(node['ids'] == ["bibtex-a_key", "a_key"])
+            case x:
+                assert(False), x
+        assert(not list(doctree.findall(addnodes.desc)))
+        assert(not list(doctree.findall(nodes.transition)))
+        assert(len(list(doctree.findall(addnodes.pending_xref))) == 4)
+
+    def test_compact_html(self, tmp_path):
+        _, outdir = _build(tmp_path, conf="bib_domain_compact = True\n", builder="html")
+        html      = (outdir / "index.html").read_text()
+        assert('<div class="bibtex entry" id="bibtex-a_key">' in html)
+        assert('<span id="a_key"></span>' in html)
+
+    def test_compact_text(self, tmp_path):
+        _, outdir = _build(tmp_path, conf="bib_domain_compact = True\n", builder="text")
+        text      = (outdir / "index.txt").read_text()
+        assert("An Example Entry (a_key)" in text)
+
+    @pytest.mark.parametrize(("builder", "output", "anchor"), [
+        ("man", "projectnamenotset.1", "a_key"),
+        ("texinfo", "projectnamenotset.texi", "@anchor{index bibtex-a_key}"),
+        ("xml", "index.xml", 'ids="bibtex-a_key a_key"'),
+    ])
+    def test_compact_other_builders(self, tmp_path, builder, output, anchor):
+        _, outdir = _build(tmp_path, conf="bib_domain_compact = True\n", builder=builder)
+        text      = (outdir / output).read_text()
+        assert("An Example Entry" in text)
+        assert(anchor in text)
+
+    @pytest.mark.parametrize("primary", ["py", "bibtex"])
+    def test_crossref_default_domain(self, tmp_path, primary):
+        """ The crossref resolves through the default domain, as the rst :ref: does """
+        doctree, outdir = _build(tmp_path, conf=f'primary_domain = "{primary}"\n', builder="html", extra=CROSSREF)
+        html            = (outdir / "index.html").read_text()
+        match [x for x in doctree.findall(addnodes.pending_xref) if x['reftype'] == "ref"]:
+            case [ref] if primary == "bibtex":
+                assert(ref['refdomain'] == "bibtex")
+                assert(ref['reftarget'] == "a_key")
+                assert('href="#bibtex-a_key"' in html)
+            case [ref]:
+                assert(ref['refdomain'] == "std")
+            case x:
+                assert(False), x
+
     ##--|
     @pytest.mark.skip
     def test_todo(self):
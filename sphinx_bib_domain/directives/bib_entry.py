@@ -7,19 +7,8 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
-import weakref
-from collections import defaultdict
-from sys import stderr
-from uuid import UUID, uuid1
 from urllib.parse import urlparse
 
 # ##-- end stdlib imports
@@ -39,6 +28,8 @@ from sphinx.util.nodes import make_refnode
 from sphinx.util.docfields import DocFieldTransformer
 from sphinx.util.logging import getLogger as getSphinxLogger
 from .. import _interface as API
+from .entry_nodes import FLAG_FIELDS, EntryNodeBuilder, link_entry
+from .parsed_entry import ParsedEntry
 
 # ##-- types
 # isort: off
@@ -80,6 +71,7 @@ class BibEntryDirective(ObjectDescription):
 
     TODO: legal fields (status, plaintiff, defendant etc)
     """
+    entry                   : ParsedEntry
 
     has_content             : bool = True
     required_arguments      : int = 1
@@ -129,25 +121,7 @@ class BibEntryDirective(ObjectDescription):
         signode['ids'].append(API.anchor(sig))
         signode['ids'].append(sig)
         self.state.document.note_explicit_target(signode)
-        domain = self.env.get_domain(API.DOMAIN_NAME)
-        domain.add_entry(sig)
-        for x,y in self.options.items():
-            match x:
-                case "author" | "editor":
-                    # TODO handle '{x and y}'
-                    domain.link_authors([a.strip() for a in y.split(" | ")])
-                case "tags":
-                    domain.link_tags([x.strip() for x in y.split(",")])
-                case "publisher":
-                    domain.link_publisher(y)
-                case "institution":
-                    domain.link_institution(y)
-                case "series":
-                    domain.link_series(y)
-                case "journal":
-                    domain.link_journal(y)
-                case _:
-                    pass
+        link_entry(self.env.get_domain(API.DOMAIN_NAME), self.entry)
 
     def before_content(self):
         """ Set the content to be rendered from the options passed in """
@@ -160,14 +134,16 @@ class BibEntryDirective(ObjectDescription):
             match x:
                 case "subtitle" | "title" | "short_parties":
                     pass
+                case _ if x in FLAG_FIELDS:
+                    pass
                 case "crossref":
                     crossref = f"| see :ref:`{y}`"
                 case "author" | "editor":
-                    _authors = " and ".join(f":author:`{a.strip()}`" for a in y.split(" | "))
+                    _authors = " and ".join(f":author:`{a}`" for a in self.entry.parties[x])
                     eds = " (eds)." if x == "editor" else ""
                     authors  = f"| {_authors}{eds}"
                 case "tags":
-                    tags    = ", ".join(f":tag:`{t.strip()}`" for t in y.split(","))
+                    tags    = ", ".join(f":tag:`{t}`" for t in self.entry.tags)
                 case "crossref":
                     simple_crossref = y
                     crossref = f"(See :ref:`{simple_crossref}`)"
@@ -181,13 +157,13 @@ class BibEntryDirective(ObjectDescription):
                 case "within":
                     adapted.append(f"| in *{y}*")
                 case "journal":
-                    adapted.append(f"| in :journal:`{y}`")
+                    adapted.append(f"| in :journal:`{self.entry.facets[x]}`")
                 case "series":
-                    adapted.append(f"| *Series*: :series:`{y}`")
+                    adapted.append(f"| *Series*: :series:`{self.entry.facets[x]}`")
                 case "institution":
-                    adapted.append(f"| :institution:`{y}`")
+                    adapted.append(f"| :institution:`{self.entry.facets[x]}`")
                 case "publisher":
-                    adapted.append(f"| :publisher:`{y}`")
+                    adapted.append(f"| :publisher:`{self.entry.facets[x]}`")
                 case "isbn":
                     adapted.append(f"| isbn: {y}")
                 case "booktitle":
@@ -216,13 +192,44 @@ class BibEntryDirective(ObjectDescription):
             case _:
                 adapted = [crossref, authors, *adapted]
 
-        self.content = "\n".join(adapted)
+        # Missing parts would be blank lines, splitting the line block:
+        self.content = "\n".join(x for x in adapted if x)
+
+    def content_nodes(self) -> list[Node]:
+        """ Build the content from the options directly,
+        unless they hold markup only the rst parser can handle,
+        or use roles that don't resolve in this document.
+        """
+        builder = EntryNodeBuilder(self.env, self.state.document, lean=self.config.bib_domain_lean)
+        if not (builder.is_plain(self.options) and builder.resolves(self.options)):
+            self.before_content()
+            return self.parse_content_to_nodes(allow_section_headings=True)
+
+        result = builder.body(self.entry)
+        for node in result:
+            self.set_source_info(node)
+            for ref in node.findall(addnodes.pending_xref):
+                self.set_source_info(ref)
+        else:
+            return result
+
+    def run_compact(self) -> list[Node]:
+        """ Build a single bib_entry node instead of the index/desc/transition tree """
+        link_entry(self.env.get_domain(API.DOMAIN_NAME), self.entry)
+        builder = EntryNodeBuilder(self.env, self.state.document)
+        node    = builder.compact_node(self.entry, self.content_nodes())
+        self.set_source_info(node)
+        return [node]
 
     def run(self) -> list[Node]:
         result : list[Node]
         ##--|
         result                     = []
         self.domain, self.objtype  = self.name.split(':', 1)
+        self.entry                 = ParsedEntry(self.arguments[0], self.options)
+        if self.config.bib_domain_compact:
+            return self.run_compact()
+
         self.indexnode             = addnodes.index(entries=[])
         source, line               = self.get_source_info()
         if line is not None:
@@ -254,16 +261,18 @@ class BibEntryDirective(ObjectDescription):
             self.handle_signature(f"({sig})", signode)
 
         ##--|
-        self.before_content()
-        content_children = self.parse_content_to_nodes(allow_section_headings=True)
-        content_node = addnodes.desc_content('', *content_children)
+        content_node = addnodes.desc_content('', *self.content_nodes())
         self.transform_content(content_node)
-        self.env.events.emit(
-            'object-description-transform', self.domain, self.objtype, content_node
-        )
-        DocFieldTransformer(self).transform_all(content_node)
+        if not self.config.bib_domain_lean:
+            self.env.events.emit(
+                'object-description-transform', self.domain, self.objtype, content_node
+            )
+            DocFieldTransformer(self).transform_all(content_node)
         node += content_node
 
         self.after_content()
 
+        if self.config.bib_domain_lean:
+            # Entries have no doc fields or index entries to process:
+            return [node, nodes.transition()]
         return [self.indexnode, node, nodes.transition()]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+A directive for a whole library of entries at once.
+
+"""
+# mypy: disable-error-code="import-untyped, import-not-found"
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from docutils import nodes
+from sphinx import addnodes
+from sphinx.util.docutils import SphinxDirective
+
+# ##-- end 3rd party imports
+
+from sphinx.util.logging import getLogger as getSphinxLogger
+from .. import _interface as API
+from .entry_nodes import EntryNodeBuilder
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from sphinx.util.typing import ExtensionMetadata, OptionSpec
+    type Node = nodes.Node
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging  = logmod.getLogger(__name__)
+sphlog   = getSphinxLogger(__name__)
+##-- end logging
+
+class BibLibraryDirective(SphinxDirective):
+    """ Renders every entry of a library in one directive.
+
+    The library is either the directive's content, or the .bib file
+    given as its argument, relative to the current document.
+    Entries are read with the stack of BibtexParser, and built into
+    the same nodes as bibtex:entry, without generating and parsing rst.
+    Entries with markup only the rst parser handles,
+    or roles that don't resolve in the document, are parsed as bibtex:entry,
+    as BibEntryDirective.content_nodes does.
+    """
+
+    has_content               : bool = True
+    optional_arguments        : int  = 1
+    final_argument_whitespace : bool = True
+    option_spec               : ClassVar[OptionSpec] = {}
+
+    def run(self) -> list[Node]:
+        from sphinx_bib_domain.parser import BibtexParser  # noqa: PLC0415
+        from sphinx_bib_domain.writer import EntryDataWriter  # noqa: PLC0415
+        result  : list[Node]
+        ##--|
+        result  = []
+        builder = EntryNodeBuilder(self.env, self.state.document,
+                                   lean=self.config.bib_domain_lean,
+                                   compact=self.config.bib_domain_compact)
+        lib     = BibtexParser().reader.read(self.library_text())
+        for block in lib.failed_blocks:
+            sphlog.warning("Failed to read bibtex block: %s", block.raw[:50], location=self.get_location())
+
+        for entry in lib.entries:
+            options = EntryDataWriter.entry_options(entry)
+            if builder.is_plain(options) and builder.resolves(options):
+                result += builder.build(entry.key, options)
+            else:
+                result += self.parse_entry(entry.key, options)
+        else:
+            for node in result:
+                self.set_source_info(node)
+                for ref in node.findall(addnodes.pending_xref):
+                    self.set_source_info(ref)
+            return result
+
+    def parse_entry(self, key:str, options:Mapping[str, str]) -> list[Node]:
+        """ Parse the rst of a bibtex:entry directive for the entry """
+        lines = [f".. {API.DOMAIN_NAME}:{API.ENTRY_OBJ_TYPE}:: {key}"]
+        for x, y in options.items():
+            first, *rest = y.splitlines() or [""]
+            lines.append(f"   :{x}: {first}")
+            lines += [f"      {z}" for z in rest]
+        else:
+            return self.parse_text_to_nodes("\n".join(lines), offset=self.content_offset)
+
+    def library_text(self) -> str:
+        match self.arguments, self.content:
+            case [path], _ if bool(self.content):
+                raise self.error(f"{self.name} takes either a .bib path or content, not both")
+            case [path], _:
+                rel, full = self.env.relfn2path(path)
+                self.env.note_dependency(rel)
+                try:
+                    return pl.Path(full).read_text()
+                except OSError as err:
+                    raise self.error(f"{self.name} could not read {path}: {err}") from err
+            case [], content if bool(content):
+                return "\n".join(content)
+            case _:
+                raise self.error(f"{self.name} needs a .bib path or entries as content")
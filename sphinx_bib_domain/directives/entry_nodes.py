@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Programmatic construction of the nodes BibEntryDirective produces,
+without going through rst and the docutils state machine.
+
+"""
+# mypy: disable-error-code="import-untyped, import-not-found"
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import re
+from types import SimpleNamespace
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from docutils import nodes
+from docutils.parsers.rst.states import Inliner
+from sphinx import addnodes
+
+# ##-- end 3rd party imports
+
+from .. import _interface as API
+from ..bib_node import bib_entry
+from .parsed_entry import ParsedEntry
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from sphinx.domains import Domain
+    from sphinx.environment import BuildEnvironment
+    type Node = nodes.Node
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+WS_RE       : Final[re.Pattern] = re.compile(r"\s+")
+DOI_URL     : Final[str]        = "https://doi.org/{}"
+# reftype -> classes, matching the role classes:
+XREF_CLASSES : Final[dict[str, list[str]]] = {
+    "author"      : ["author"],
+    "tag"         : ["xref", "tag"],
+    "journal"     : ["journal"],
+    "publisher"   : ["publisher"],
+    "institution" : ["institution"],
+    "series"      : ["series"],
+}
+# field -> the unqualified role its rst uses:
+FIELD_ROLES  : Final[dict[str, str]] = {
+    "author"      : "author",
+    "editor"      : "author",
+    "tags"        : "tag",
+    "journal"     : "journal",
+    "series"      : "series",
+    "publisher"   : "publisher",
+    "institution" : "institution",
+    "doi"         : "doi",
+    "crossref"    : "ref",
+}
+# Fields rendered inside roles, or as the signature, rather than as inline rst text:
+ROLE_FIELDS  : Final[frozenset[str]] = frozenset(["author", "editor", "tags", "journal", "series",
+                                                  "publisher", "institution", "doi", "url", "crossref"])
+SIG_FIELDS   : Final[frozenset[str]] = frozenset(["title", "subtitle", "short_parties", "year"])
+# Directive flags, which have no value and are not rendered:
+FLAG_FIELDS  : Final[frozenset[str]] = frozenset(["no-index", "no-index-entry", "no-contents-entry", "no-typesetting"])
+# Text that rst would read as more than text:
+TEXT_MARKUP_RE : Final[re.Pattern] = re.compile(r"[*`|_\\\[\]\n]")
+ROLE_MARKUP_RE : Final[re.Pattern] = re.compile(r"[`<>\\\n]")
+# Body:
+
+def _standalone_re() -> re.Pattern:
+    """ The docutils pattern for text it autolinks: standalone uris of any scheme, emails,
+    and pep/rfc references, which are included in case a project enables them.
+    """
+    inliner = Inliner()
+    inliner.init_customizations(SimpleNamespace(character_level_inline_markup=False,
+                                                pep_references=True,
+                                                rfc_references=True))
+    return inliner.patterns.uri
+
+STANDALONE_RE : Final[re.Pattern] = _standalone_re()
+
+def link_entry(domain:Any, entry:ParsedEntry) -> None:
+    """ Register an entry and its facets with the domain """
+    domain.add_entry(entry.key)
+    for x,y in entry.options.items():
+        match x:
+            case "author" | "editor":
+                domain.link_authors(entry.parties[x])
+            case "tags":
+                domain.link_tags(entry.tags)
+            case "publisher":
+                domain.link_publisher(entry.facets[x])
+            case "institution":
+                domain.link_institution(entry.facets[x])
+            case "series":
+                domain.link_series(entry.facets[x])
+            case "journal":
+                domain.link_journal(entry.facets[x])
+            case "year":
+                domain.link_year(y)
+            case _:
+                pass
+
+class EntryNodeBuilder:
+    """ Builds the index/desc/transition nodes of a bibtex:entry,
+    and registers it with the domain.
+
+    Produces the same tree as BibEntryDirective does
+    from the rst of entry.rst.jinja.
+    When lean, the empty index node and object-description-transform are skipped,
+    as BibEntryDirective does with bib_domain_lean.
+    When compact, a single bib_entry node is built instead.
+    """
+    env      : BuildEnvironment
+    document : nodes.document
+    lean     : bool
+    compact  : bool
+
+    def __init__(self, env:BuildEnvironment, document:nodes.document, *, lean:bool=False, compact:bool=False) -> None:
+        self.env      = env
+        self.document = document
+        self.lean     = lean
+        self.compact  = compact
+
+    def build(self, sig:str, options:Mapping[str, str]) -> list[Node]:
+        entry            = ParsedEntry(sig, options)
+        if self.compact:
+            link_entry(self.env.get_domain(API.DOMAIN_NAME), entry)
+            return [self.compact_node(entry, self.body(entry))]
+
+        node             = addnodes.desc()
+        node.document    = self.document
+        node['domain']   = API.DOMAIN_NAME
+        node['objtype']  = API.ENTRY_OBJ_TYPE
+        node['classes'] += [API.DOMAIN_NAME, API.ENTRY_OBJ_TYPE]
+
+        signode = self.signature(entry)
+        node.append(signode)
+        link_entry(self.env.get_domain(API.DOMAIN_NAME), entry)
+
+        content_node = addnodes.desc_content('', *self.body(entry))
+        if not self.lean:
+            self.env.events.emit('object-description-transform',
+                                 API.DOMAIN_NAME, API.ENTRY_OBJ_TYPE, content_node)
+        node += content_node
+        if self.lean:
+            return [node, nodes.transition()]
+        return [addnodes.index(entries=[]), node, nodes.transition()]
+
+    def signature(self, entry:ParsedEntry) -> addnodes.desc_signature:
+        sig     = entry.key
+        signode = addnodes.desc_signature(is_multiline=True)
+        signode.source = self.document.get('source')
+        if entry.title is not None:
+            signode += addnodes.desc_signature_line('', entry.title)
+
+        signode['ids'].append(API.anchor(sig))
+        signode['ids'].append(sig)
+        self.document.note_explicit_target(signode)
+        signode += addnodes.desc_signature_line('', f"({sig})")
+        return signode
+
+    def compact_node(self, entry:ParsedEntry, body:list[Node]) -> bib_entry:
+        """ A bib_entry with the same anchors as 'signature', holding the title and body """
+        node         = bib_entry('', key=entry.key, title=entry.title or "")
+        node.source  = self.document.get('source')
+        node['ids'] += [API.anchor(entry.key), entry.key]
+        self.document.note_explicit_target(node)
+        heading      = nodes.paragraph('', '', classes=["bibtex-title"])
+        if entry.title is not None:
+            heading += nodes.Text(f"{entry.title} ")
+        heading     += nodes.inline('', f"({entry.key})", classes=["bibtex-key"])
+        node        += heading
+        node.extend(body)
+        return node
+
+    @staticmethod
+    def is_plain(options:Mapping[str, str]) -> bool:
+        """ Whether the rst of these options would parse to exactly the nodes of 'body'.
+        Values with inline markup, uris or emails need the rst parser.
+        """
+        for x,y in options.items():
+            match x:
+                case _ if x in SIG_FIELDS or x in FLAG_FIELDS:
+                    pass
+                case _ if x in ROLE_FIELDS and ROLE_MARKUP_RE.search(y):
+                    return False
+                case _ if x not in ROLE_FIELDS and TEXT_MARKUP_RE.search(y):
+                    return False
+                case _ if x not in ROLE_FIELDS and STANDALONE_RE.search(y):
+                    return False
+                case _:
+                    pass
+        else:
+            return True
+
+    def role_domain(self, role:str) -> Maybe[Domain]:
+        """ The domain an unqualified role resolves in, as sphinx looks it up:
+        the default domain, then std.
+        """
+        for domain in [self.env.current_document.default_domain, self.env.get_domain("std")]:
+            if domain is not None and role in domain.roles:
+                return domain
+        else:
+            return None
+
+    def resolves(self, options:Mapping[str, str]) -> bool:
+        """ Whether every role the rst of these options uses resolves.
+        Otherwise the rst parser reports them, so it has to be used.
+        """
+        return all(self.role_domain(FIELD_ROLES[x]) is not None for x in options if x in FIELD_ROLES)
+
+    def body(self, entry:ParsedEntry) -> list[Node]:
+        """ The desc_content children: a line_block of the entry's details, if it has any """
+        match self.content(entry):
+            case []:
+                return []
+            case lines:
+                return [nodes.line_block('', *lines)]
+
+    def content(self, entry:ParsedEntry) -> list[nodes.line]:
+        """ The line_block lines, in the order BibEntryDirective.before_content uses """
+        adapted   : list[list[Node]]  = []
+        authors   : list[Node]        = []
+        crossref  : list[Node]        = []
+        tags      : list[Node]        = []
+        url       : list[Node]        = []
+        doi       : list[Node]        = []
+
+        for x,y in entry.options.items():
+            match x:
+                case "subtitle" | "title" | "short_parties" | "year":
+                    pass
+                case _ if x in FLAG_FIELDS:
+                    pass
+                case "crossref":
+                    crossref = [nodes.Text("see "), self._ref(y)]
+                case "author" | "editor":
+                    authors = self._joined("author", entry.parties[x], " and ")
+                    if x == "editor":
+                        authors.append(nodes.Text(" (eds)."))
+                case "tags":
+                    tags = self._joined("tag", entry.tags, ", ")
+                case "edition" | "edition_year":
+                    adapted.append([nodes.Text(f"{y} Edition")])
+                case "url":
+                    url = [nodes.reference(f"`Link <{y}>`__", "Link", name="Link", refuri=y)]
+                case "doi":
+                    ref  = nodes.reference('', '', internal=False, refuri=DOI_URL.format(y), classes=["xref", "doi"])
+                    ref += nodes.literal("DOI", "DOI")
+                    doi  = [ref]
+                case "within" | "booktitle":
+                    adapted.append([nodes.Text("in "), nodes.emphasis(f"*{y}*", y)])
+                case "journal":
+                    adapted.append([nodes.Text("in "), self._xref("journal", entry.facets[x])])
+                case "series":
+                    adapted.append([nodes.emphasis("*Series*", "Series"), nodes.Text(": "), self._xref("series", entry.facets[x])])
+                case "institution" | "publisher":
+                    adapted.append([self._xref(x, entry.facets[x])])
+                case "isbn":
+                    adapted.append([nodes.Text(f"isbn: {y}")])
+                case "identifier":
+                    adapted.append([nodes.Text(f"ID: {y}")])
+                case x:
+                    adapted.append([nodes.Text(f"{x.title()}: {y}")])
+        else:
+            adapted = [crossref, authors, *adapted, doi, url, tags]
+            return [nodes.line('', '', *parts) for parts in adapted if parts]
+
+    def _joined(self, reftype:str, values:list[str], sep:str) -> list[Node]:
+        result : list[Node] = []
+        for i, val in enumerate(values):
+            if i:
+                result.append(nodes.Text(sep))
+            result.append(self._xref(reftype, val))
+        else:
+            return result
+
+    def _xref(self, reftype:str, text:str) -> addnodes.pending_xref:
+        """ A facet xref, in the domain the unqualified role resolves in.
+        Falls back to the bibtex domain, which always defines the facet roles.
+        """
+        rawtext  = f":{reftype}:`{text}`"
+        domain   = self.role_domain(reftype) or self.env.get_domain(API.DOMAIN_NAME)
+        refnode  = addnodes.pending_xref(rawtext,
+                                         refdoc=self.env.docname,
+                                         refdomain=domain.name,
+                                         reftype=reftype,
+                                         refexplicit=False,
+                                         refwarn=False)
+        refnode['reftarget'] = WS_RE.sub(" ", text)
+        refnode += nodes.literal(rawtext, text, classes=XREF_CLASSES[reftype])
+        return refnode
+
+    def _ref(self, text:str) -> addnodes.pending_xref:
+        """ A :ref: xref, resolved through the default domain first, as the rst role would be """
+        rawtext = f":ref:`{text}`"
+        domain  = self.env.current_document.default_domain
+        if domain is None or "ref" not in domain.roles:
+            domain = self.env.get_domain("std")
+
+        role     = domain.roles["ref"]
+        target   = WS_RE.sub(" ", text)
+        refnode  = addnodes.pending_xref(rawtext,
+                                         refdoc=self.env.docname,
+                                         refdomain=domain.name,
+                                         reftype="ref",
+                                         refexplicit=False,
+                                         refwarn=getattr(role, "warn_dangling", False))
+        refnode['reftarget'] = target.lower() if getattr(role, "lowercase", False) else target
+        inner    = getattr(role, "innernodeclass", nodes.literal)
+        refnode += inner(rawtext, text, classes=["xref", domain.name, f"{domain.name}-ref"])
+        return refnode
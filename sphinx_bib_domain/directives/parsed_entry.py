@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+The options of a bibtex:entry, parsed once
+for both domain linking and content rendering.
+
+"""
+# mypy: disable-error-code="import-untyped, import-not-found"
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import re
+
+# ##-- end stdlib imports
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+# ' | ' joins the names bib_domain generates, ' and ' separates bibtex names:
+NAME_SEP_RE  : Final[re.Pattern]      = re.compile(r" \| |\s+and\s+", re.IGNORECASE)
+PARTY_FIELDS : Final[tuple[str, ...]] = ("author", "editor")
+FACET_FIELDS : Final[tuple[str, ...]] = ("publisher", "institution", "series", "journal")
+# Body:
+
+class ParsedEntry:
+    """ A bibtex:entry's key and options, with the multi-valued ones split and normalised.
+
+    parties : field -> names, for author and editor.
+              Names are split on ' | ' and bibtex's ' and ',
+              but not within braces, so '{Barnes and Noble}' is one name, 'Barnes and Noble'.
+    tags    : the comma separated tags, stripped.
+    facets  : field -> stripped value, for publisher, institution, series and journal.
+    title   : the signature line, from title and subtitle, or short_parties.
+    """
+    __slots__ = ("facets", "key", "options", "parties", "tags", "title")
+    key      : str
+    title    : Maybe[str]
+    options  : Mapping[str, str]
+    parties  : dict[str, list[str]]
+    tags     : list[str]
+    facets   : dict[str, str]
+
+    @staticmethod
+    def split_names(value:str) -> list[str]:
+        """ Split names on separators outside of braces, and unwrap fully braced names """
+        names : list[str]  = []
+        start : int        = 0
+        for sep in NAME_SEP_RE.finditer(value):
+            if value.count("{", 0, sep.start()) != value.count("}", 0, sep.start()):
+                continue
+            names.append(value[start:sep.start()])
+            start = sep.end()
+        else:
+            names.append(value[start:])
+            return [ParsedEntry.unbrace(x.strip()) for x in names]
+
+    @staticmethod
+    def unbrace(name:str) -> str:
+        """ Remove braces that wrap the whole of a name """
+        depth = 0
+        if not (name.startswith("{") and name.endswith("}")):
+            return name
+        for i, char in enumerate(name):
+            match char:
+                case "{":
+                    depth += 1
+                case "}":
+                    depth -= 1
+                case _:
+                    pass
+            if depth == 0 and i < len(name) - 1:
+                return name
+        else:
+            return name[1:-1].strip()
+
+    def __init__(self, key:str, options:Mapping[str, str]) -> None:
+        self.key      = key
+        self.options  = options
+        self.parties  = {x : self.split_names(options[x]) for x in PARTY_FIELDS if x in options}
+        self.tags     = [x.strip() for x in options["tags"].split(",")] if "tags" in options else []
+        self.facets   = {x : options[x].strip() for x in FACET_FIELDS if x in options}
+        match options:
+            case {"title": title, "subtitle": sub}:
+                self.title = f"{title}: {sub}"
+            case {"title": title}:
+                self.title = title
+            case {"short_parties": short}:
+                self.title = short
+            case _:
+                self.title = None
+
+    def __repr__(self) -> str:
+        return f"<ParsedEntry: {self.key}>"
@@ -6,9 +6,11 @@
 # Imports:
 from __future__ import annotations
 
+from ._engine import FacetIndex, FacetIndexEngine
 from .author import AuthorIndex
 from .institution import InstitutionIndex
 from .journal import JournalIndex
 from .publisher import PublisherIndex
 from .series import SeriesIndex
 from .tag import TagIndex
+from .year import YearIndex
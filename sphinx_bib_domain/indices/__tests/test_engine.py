@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+TEST File updated
+
+"""
+# ruff: noqa: ANN201, ARG001, ANN001, ARG002, ANN202, B011
+
+# Imports
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+import types
+import warnings
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+# ##-- end 3rd party imports
+
+from ...bib_domain import BibTexDomain
+from .._engine import FacetIndexEngine, FacetIndex
+from ..author import AuthorIndex
+from ..journal import JournalIndex
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+# from dataclasses import InitVar, dataclass, field
+# from pydantic import BaseModel, Field, model_validator, field_validator, ValidationError
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+
+@pytest.fixture
+def domain():
+    domain = BibTexDomain(types.SimpleNamespace(domaindata={}, docname="doc_a"))
+    for sig, authors, journal in [("second", ["bob", "amy"], "Nature"),
+                                  ("first", ["bob"], "Nature"),
+                                  ("third", ["carl"], "")]:
+        domain.add_entry(sig)
+        domain.link_authors(authors)
+        domain.link_journal(journal)
+    return domain
+
+class TestFacetIndexEngine:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_build(self, domain):
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex, JournalIndex])
+        result  = engine.build()
+        assert(set(result.keys()) == {"authors", "journals"})
+        letters = [x[0] for x in result['authors']]
+        assert(letters == ["A", "B", "C"])
+        b_entries = result['authors'][1][1]
+        assert(b_entries[0].name == "bob (2)")
+        assert([x.name for x in b_entries[1:]] == ["first", "second"])
+        assert(b_entries[1].docname == "doc_a")
+        assert(b_entries[1].anchor == "bibtex-first")
+
+    def test_journal_heading(self, domain):
+        result = FacetIndexEngine(domain.data, [JournalIndex]).build()
+        heading = result['journals'][0][1][0]
+        assert(heading.name == "Nature")
+        assert(heading.descr == "(2)")
+
+    def test_rows_shared(self, domain):
+        result = FacetIndexEngine(domain.data, [AuthorIndex, JournalIndex]).build()
+        author_row  = result['authors'][1][1][1]
+        journal_row = result['journals'][0][1][1]
+        assert(author_row is journal_row)
+
+    def test_index_view(self, domain):
+        content, collapse = AuthorIndex(domain).generate()
+        assert(collapse)
+        assert(content == domain.facet_index_content("authors"))
+
+    def test_only_dirty_buckets_rebuilt(self, domain, mocker):
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex])
+        engine.build()
+        assert(domain.data['index_dirty'] == {"journals": {"N"}})
+        domain.env.docname = "doc_b"
+        domain.add_entry("fourth")
+        domain.link_authors(["adam"])
+        spy     = mocker.spy(engine, "_build_bucket")
+        result  = engine.build()
+        assert(spy.call_count == 1)
+        assert([x.name for x in result['authors'][0][1]] == ["adam (1)", "fourth", "amy (1)", "second"])
+
+    def test_docnames_filter(self, domain, mocker):
+        domain.env.docname = "doc_b"
+        domain.add_entry("fourth")
+        domain.link_authors(["bob", "dan"])
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex])
+        engine.build()
+        result  = engine.build(docnames=["doc_b"])
+        assert([x[0] for x in result['authors']] == ["B", "D"])
+        assert([x.name for x in result['authors'][0][1]] == ["bob (1)", "fourth"])
+        assert(domain.data['index_cache']['authors'].keys() == {"A", "B", "C", "D"})
+
+    def test_docnames_filter_touched_buckets(self, domain, mocker):
+        domain.env.docname = "doc_b"
+        domain.add_entry("fourth")
+        domain.link_authors(["dan"])
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex])
+        spy     = mocker.spy(engine, "_build_bucket")
+        result  = engine.build(docnames=["doc_b"])
+        assert(spy.call_count == 1)
+        assert(spy.call_args.args[1] == ["dan"])
+        assert([x[0] for x in result['authors']] == ["D"])
+
+    def test_docnames_filter_uncached(self, domain, mocker):
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex])
+        engine.build()
+        cached  = domain.data['index_cache']['authors']['B']
+        engine.build(docnames=[])
+        assert(domain.data['index_cache']['authors']['B'] is cached)
+
+    def test_update_index_cache(self, domain):
+        domain.update_index_cache()
+        assert(domain.data['index_dirty'] == {})
+        assert(set(domain.data['index_cache']) >= {"authors", "journals"})
+        assert(domain.data['index_cache']['authors'].keys() == {"A", "B", "C"})
+
+    def test_removed_bucket(self, domain):
+        engine  = FacetIndexEngine(domain.data, [AuthorIndex])
+        engine.build()
+        domain.clear_doc("doc_a")
+        assert(engine.build()['authors'] == [])
+
+    def test_cache_invalidated(self, domain):
+        first = domain.facet_index_content("authors")
+        assert(domain.facet_index_content("authors") is first)
+        domain.add_entry("fourth")
+        domain.link_authors(["dan"])
+        second = domain.facet_index_content("authors")
+        assert(second is not first)
+        assert([x[0] for x in second] == ["A", "B", "C", "D"])
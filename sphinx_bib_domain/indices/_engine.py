@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# mypy: disable-error-code="import-untyped,import-not-found"
+
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import types
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from docutils import nodes
+from docutils.parsers.rst import directives
+from sphinx import addnodes
+from sphinx.directives import ObjectDescription
+from sphinx.domains import Domain, Index, IndexEntry, ObjType
+from sphinx.domains.std import StandardDomain
+from sphinx.roles import AnyXRefRole, ReferenceRole, XRefRole
+from sphinx.util.nodes import make_refnode
+
+# ##-- end 3rd party imports
+
+from sphinx_bib_domain._interface import index_bucket
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+# from dataclasses import InitVar, dataclass, field
+# from pydantic import BaseModel, Field, model_validator, field_validator, ValidationError
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type IndexContent = list[tuple[str, list[IndexEntry]]]
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+class FacetIndex(Index):
+    """ Base class for the bibtex facet indices (tags, authors etc).
+
+    Facet indices are views over the content a FacetIndexEngine
+    builds for all facets at once, and cached on the domain.
+    """
+    facet : ClassVar[str]
+
+    @classmethod
+    def heading(cls, key:str, count:int) -> IndexEntry:
+        """ The group heading of a key in the index """
+        return IndexEntry(f"{key} ({count})", 1, "",  "", "", "", "")
+
+    @classmethod
+    def bucket_label(cls, bucket:str|int) -> str:
+        """ The name of a bucket's page in the index """
+        return str(bucket)
+
+    def generate(self, docnames:Maybe[Iterable[str]]=None) -> tuple[IndexContent, bool]:
+        collapse = True
+        return self.domain.facet_index_content(self.facet, docnames=docnames), collapse
+
+class FacetIndexEngine:
+    """ Builds the content of every facet index in a single pass over the domain data.
+
+    The sorted buckets the domain maintains provide the order,
+    and the IndexEntry of each bibtex entry is built once and shared between facets.
+
+    Built buckets are cached in data['index_cache'], and only buckets
+    the domain has marked in data['index_dirty'] are rebuilt.
+    Content restricted to docnames is built without the cache.
+    """
+    _data     : dict
+    _facets   : dict[str, type[FacetIndex]]
+
+    def __init__(self, data:dict, facets:Iterable[type[FacetIndex]]) -> None:
+        self._data    = data
+        self._facets  = {x.facet : x for x in facets}
+
+    def build(self, *, docnames:Maybe[Iterable[str]]=None) -> dict[str, IndexContent]:
+        """ Build the content of all facets, only including entries from docnames if given """
+        result  : dict[str, IndexContent]  = {}
+        rows    : dict[str, IndexEntry]    = {}
+        if docnames is not None:
+            return self._build_filtered(frozenset(docnames), rows)
+
+        cache   = self._data['index_cache']
+        dirty   = self._data['index_dirty']
+        for facet, index_cls in self._facets.items():
+            buckets      = self._data['letters'][facet]
+            facet_cache  = cache.setdefault(facet, {})
+            stale        = dirty.pop(facet, set())
+            stale       |= buckets.keys() - facet_cache.keys()
+            for bucket in stale:
+                if bucket in buckets:
+                    facet_cache[bucket] = self._build_bucket(index_cls, buckets[bucket], rows)
+                else:
+                    facet_cache.pop(bucket, None)
+            else:
+                result[facet] = [(index_cls.bucket_label(x), facet_cache[x]) for x in sorted(facet_cache)]
+        else:
+            return result
+
+    def _build_filtered(self, docnames:frozenset[str], rows:dict[str, IndexEntry]) -> dict[str, IndexContent]:
+        """ Build the content of all facets from scratch, with only the entries of docnames.
+        Only the keys those documents linked are visited, found through data['docs'].
+        """
+        result  : dict[str, IndexContent]  = {}
+        touched : dict[str, dict]          = {x : {} for x in self._facets}
+        docs    = self._data['docs']
+        for docname in docnames:
+            if docname not in docs:
+                continue
+            for table, key in docs[docname]['links']:
+                if table in touched and key in self._data[table]:
+                    touched[table].setdefault(index_bucket(key), set()).add(key)
+
+        for facet, index_cls in self._facets.items():
+            buckets        = touched[facet]
+            result[facet]  = []
+            for bucket in sorted(buckets):
+                if (bucket_entries:=self._build_bucket(index_cls, sorted(buckets[bucket]), rows, docnames=docnames)):
+                    result[facet].append((index_cls.bucket_label(bucket), bucket_entries))
+        else:
+            return result
+
+    def _build_bucket(self, index_cls:type[FacetIndex], keys:list, rows:dict[str, IndexEntry], *, docnames:Maybe[frozenset[str]]=None) -> list[IndexEntry]:
+        """ Build the index entries of a single bucket """
+        bucket_entries  = []
+        table           = self._data[index_cls.facet]
+        entries         = self._data['entries']
+        for key in keys:
+            sigs = table[key]
+            if docnames is not None:
+                sigs = [x for x in sigs if x in entries and entries[x].docname in docnames]
+                if not bool(sigs):
+                    continue
+            bucket_entries.append(index_cls.heading(key, len(sigs)))
+            for sig in sigs:
+                if sig not in entries:
+                    continue
+                if sig not in rows:
+                    record    = entries[sig]
+                    rows[sig] = IndexEntry(record.key, 2, record.docname, record.anchor, '', '', '')
+                bucket_entries.append(rows[sig])
+        else:
+            return bucket_entries
@@ -8,23 +8,9 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
 import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
@@ -41,6 +27,7 @@ from sphinx.util.nodes import make_refnode
 
 from sphinx.util.logging import getLogger as getSphinxLogger
 from sphinx_bib_domain._interface import DOMAIN_NAME
+from ._engine import FacetIndex
 
 # ##-- types
 # isort: off
@@ -78,29 +65,10 @@ sphlog = getSphinxLogger(__name__)
 
 # Body:
 
-class InstitutionIndex(Index):
+class InstitutionIndex(FacetIndex):
     """ A Custom index for sphinx """
 
     name      = 'institution-index'
     localname = 'Institution Index'
     shortname = 'instindex'
-
-    def generate(self, docnames=None) -> tuple[Any, bool]:
-        """ """
-        content : dict[str, list[IndexEntry]] = collections.defaultdict(list)
-        collapse = True
-        entries = self.domain.data['entries']
-
-        for institution, sigs in sorted(self.domain.data['institutions'].items()):
-            sigs = sorted(sigs)
-            sig_count = len(sigs)
-            letter = institution[0].upper()
-            content[letter].append(IndexEntry(f"{institution} ({sig_count})", 1, "",  "", "", "", ""))
-            for sig in sigs:
-                if sig not in entries:
-                    continue
-                obj = entries[sig]
-                name = obj[0].removeprefix(f"{DOMAIN_NAME}.")
-                content[letter].append(IndexEntry(name, 2, obj[2], obj[3], '', '', ''))
-        else:
-            return sorted(content.items()), collapse
+    facet     = 'institutions'
@@ -8,23 +8,9 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
 import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
@@ -40,6 +26,7 @@ from sphinx.util.nodes import make_refnode
 # ##-- end 3rd party imports
 
 from sphinx_bib_domain._interface import DOMAIN_NAME
+from ._engine import FacetIndex
 
 # ##-- types
 # isort: off
@@ -76,32 +63,16 @@ logging = logmod.getLogger(__name__)
 
 # Body:
 
-class JournalIndex(Index):
+class JournalIndex(FacetIndex):
     """ A Custom index for sphinx """
 
     name      = 'journal-index'
     localname = 'Journal Index'
     shortname = 'jourindex'
+    facet     = 'journals'
 
-    def generate(self, docnames=None) -> tuple[Any, bool]:
-        """ """
-        content : dict[str, list[IndexEntry]] = collections.defaultdict(list)
-        collapse = True
-        entries = self.domain.data['entries']
-
-        for pub, sigs in sorted(self.domain.data['journals'].items()):
-            sigs      = sorted(sigs)
-            sig_count = len(sigs)
-            letter    = pub[0].upper()
-            # For some reason this causes the toggle to disappear:
-            # content[letter].append(IndexEntry(f"{pub} ({sig_count})", 1, "",  "", "", "", ""))
-            content[letter].append(IndexEntry(f"{pub}", 1, "",  "", "", "", f"({sig_count})"))
-            for sig in sigs:
-                if sig not in entries:
-                    continue
-                obj = entries[sig]
-                name = obj[0].removeprefix(f"{DOMAIN_NAME}.")
-                content[letter].append(IndexEntry(name, 2, obj[2], obj[3], '', '', ''))
-        else:
-            return sorted(content.items()), collapse
-
+    @override
+    @classmethod
+    def heading(cls, key:str, count:int) -> IndexEntry:
+        # For some reason putting the count in the name causes the toggle to disappear:
+        return IndexEntry(key, 1, "",  "", "", "", f"({count})")
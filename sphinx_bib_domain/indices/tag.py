@@ -8,23 +8,9 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
 import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
@@ -40,6 +26,7 @@ from sphinx.util.nodes import make_refnode
 # ##-- end 3rd party imports
 
 from sphinx_bib_domain._interface import DOMAIN_NAME
+from ._engine import FacetIndex
 
 # ##-- types
 # isort: off
@@ -75,31 +62,10 @@ logging = logmod.getLogger(__name__)
 # Vars:
 
 # Body:
-class TagIndex(Index):
+class TagIndex(FacetIndex):
     """ A Custom index for sphinx """
 
     name      = 'tag-index'
     localname = 'Tag Index'
     shortname = 'tagindex'
-
-    def generate(self, docnames=None) -> tuple[list, bool]:
-        content : dict[str, list[IndexEntry]] = collections.defaultdict(list)
-        collapse = True
-        entries = self.domain.data['entries']
-
-        for tag in sorted(self.domain.data['tags'].keys()):
-            sigs = sorted(self.domain.data['tags'][tag])
-            if not bool(sigs):
-                continue
-            letter = tag[0].upper()
-            sig_count = len(sigs)
-            content[letter].append(IndexEntry(f"{tag} ({sig_count})", 1, "",  "", "", "", ""))
-            for sig in sigs:
-                if sig not in entries:
-                    continue
-                obj = entries[sig]
-                name = obj[0].removeprefix(f"{DOMAIN_NAME}.")
-                content[letter].append(IndexEntry(name, 2, obj[2], obj[3], '', '', ''))
-
-        else:
-            return sorted(content.items()), collapse
+    facet     = 'tags'
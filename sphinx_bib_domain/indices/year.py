@@ -8,23 +8,9 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
 import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
@@ -40,6 +26,7 @@ from sphinx.util.nodes import make_refnode
 # ##-- end 3rd party imports
 
 from sphinx_bib_domain._interface  import DOMAIN_NAME
+from ._engine import FacetIndex
 
 # ##-- types
 # isort: off
@@ -76,31 +63,19 @@ logging = logmod.getLogger(__name__)
 
 # Body:
 
-class YearIndex(Index):
-    """ A Custom index for sphinx, covering years"""
+class YearIndex(FacetIndex):
+    """ A Custom index for sphinx, covering years.
+
+    Years are stored as ints, and bucketed by decade as they are linked,
+    so there is no string sorting of years.
+    """
 
     name      = 'year-index'
     localname = 'Year Index'
     shortname = 'yearindex'
+    facet     = 'years'
 
-    def generate(self, docnames=None) -> tuple[Any, bool]:
-        """ """
-        content : dict[str, list[IndexEntry]] = collections.defaultdict(list)
-        collapse = True
-        entries = self.domain.data['entries']
-
-        raise NotImplementedError()
-
-        for author, sigs in sorted(self.domain.data['authors'].items()):
-            sigs = sorted(sigs)
-            letter = author[0].upper()
-            sig_count = len(sigs)
-            content[letter].append(IndexEntry(f"{author} ({sig_count})", 1, "",  "", "", "", ""))
-            for sig in sigs:
-                if sig not in entries:
-                    continue
-                obj = entries[sig]
-                name = obj[0].removeprefix(f"{DOMAIN_NAME}.")
-                content[letter].append(IndexEntry(name, 2, obj[2], obj[3], '', '', ''))
-        else:
-            return sorted(content.items()), collapse
+    @override
+    @classmethod
+    def bucket_label(cls, bucket:str|int) -> str:
+        return f"{bucket}s"
@@ -7,31 +7,21 @@ from __future__ import annotations
 # Imports:
 
 # ##-- stdlib imports
-import datetime
-import enum
 import functools as ftz
 import itertools as itz
 import logging as logmod
 import pathlib as pl
-import re
 import time
-import collections
-import contextlib
-import hashlib
-from copy import deepcopy
-from uuid import UUID, uuid1
-from weakref import ref
-import atexit # for @atexit.register
-import faulthandler
 # ##-- end stdlib imports
 
-from docutils.statemachine import StringList # type: ignore[import-untyped]
+# bibble, bibtexparser and jinja are imported when first needed,
+# so projects without .bib sources don't pay for them.
+from docutils import nodes # type: ignore[import-untyped]
 from sphinx.parsers import RSTParser as SphinxParser # type: ignore[import-untyped]
 from sphinx.util.logging import getLogger as getSphinxLogger
-from sphinx_bib_domain._interface import TEMPLATES_DIR
-import bibble as BM
-import bibble._interface as API
-from bibble.io import JinjaWriter, Reader
+from sphinx_bib_domain._interface import DOMAIN_NAME, TEMPLATES_DIR, ENTRY_START_RE, LIB_STORE_DIR
+from sphinx_bib_domain.directives import EntryNodeBuilder
+from sphinx_bib_domain.util import BibCache, BibSharder
 
 # ##-- types
 # isort: off
@@ -58,7 +48,11 @@ if typing.TYPE_CHECKING:
     from collections.abc import Sequence, Mapping, MutableMapping, Hashable
 
     from jgdv import Maybe
-    from docutils import nodes
+    from docutils.statemachine import StringList # type: ignore[import-untyped]
+    from bibtexparser.library import Library
+    import bibble._interface as API
+    from bibble.io import Reader
+    from sphinx_bib_domain.writer import BibJinjaWriter, EntryDataWriter, FragmentCacheWriter
 ## isort: on
 # ##-- end type checking
 
@@ -68,8 +62,58 @@ sphlog = getSphinxLogger(__name__)
 ##-- end logging
 
 # Vars:
+CACHE_VERSION      : Final[str]            = "4"
+BYTECODE_DIR       : Final[str]            = "jinja"
+_SHARED            : Final[dict[Hashable, Any]] = {}
 # Body:
 
+def shared[T](key:Hashable, factory:Callable[[], T]) -> T:
+    """ Get, or build once, a value shared by every parser in this process """
+    if key not in _SHARED:
+        _SHARED[key] = factory()
+
+    return _SHARED[key]
+
+def split_entries(text:str, size:int) -> list[tuple[int, str]]:
+    """ Split bibtex text on entry boundaries into chunks of 'size' entries.
+
+    Returns (line offset, chunk) pairs.
+    """
+    starts = [x.start() for x in ENTRY_START_RE.finditer(text)]
+    if len(starts) <= size:
+        return [(0, text)]
+
+    chunks : list[tuple[int, str]] = []
+    line   = 0
+    for start, end in itz.pairwise([0, *starts[size::size], len(text)]):
+        chunk = text[start:end]
+        chunks.append((line, chunk))
+        line += chunk.count("\n")
+    else:
+        return chunks
+
+def read_chunk(chunk:str, line:int, render:bool, template_dirs:list) -> tuple[Library, dict[str, list[str]]]:
+    """ Process pool job: read a chunk of bibtex, and render its entries.
+
+    Duplicate keys are left for the parent to handle, across all chunks.
+    Returns the library and the rendered fragments of its entries.
+    """
+    import bibble as BM  # noqa: PLC0415
+    from bibble.io import Reader  # noqa: PLC0415
+    from sphinx_bib_domain.writer import FragmentCacheWriter  # noqa: PLC0415
+    parser  = BibtexParser()
+    stack   = [x for x in parser._stack.read_stack() if not isinstance(x, BM.failure.DuplicateKeyHandler)]
+    lib     = Reader(stack).read(chunk)
+    for block in lib.blocks:
+        if block.start_line is not None:
+            block._start_line_in_file += line
+
+    if not render:
+        return lib, {}
+
+    writer  = parser.shared_writer(FragmentCacheWriter, template_dirs, None)
+    return lib, {writer.entry_hash(x) : writer.visit_entry(x) for x in lib.entries}
+
 class BibtexParser(SphinxParser):
     """
     A Sphinx Parser for bibtex files.
@@ -77,12 +121,15 @@ class BibtexParser(SphinxParser):
     supported : tuple[str, ...] = ("bib", "bibtex")
     _stack : API.PairStack_p
     reader : Reader
-    writer : JinjaWriter
+    writer : FragmentCacheWriter|EntryDataWriter
+    cache   : Maybe[BibCache]
+    sharder : Maybe[BibSharder]
 
     def __init__(self, *args, **kwargs) -> None:
+        from bibble.io import Reader  # noqa: PLC0415
         super().__init__(*args, **kwargs)
-        self._stack = self.build_stack()
-        self.reader = Reader(self._stack)
+        self._stack = shared((type(self), "stack"), self.build_stack)
+        self.reader = shared((type(self), "reader"), ftz.partial(Reader, self._stack))
         self._templates = {
             "lib"     : "bib_domain/lib.rst.jinja",
             "header"  : "bib_domain/header.rst.jinja",
@@ -92,13 +139,18 @@ class BibtexParser(SphinxParser):
 
     @override
     def set_application(self, app) -> None:
+        from sphinx_bib_domain.writer import EntryDataWriter, FragmentCacheWriter  # noqa: PLC0415
         super().set_application(app)
-        self.writer = JinjaWriter(self._stack,
-                                  templates=[self.config.bib_domain_templates, TEMPLATES_DIR])
-        self.writer.update_templates(self._templates)
+        writer_cls   = EntryDataWriter if self.config.bib_domain_direct else FragmentCacheWriter
+        self.cache   = self.build_cache()
+        self.writer  = self.shared_writer(writer_cls,
+                                          [self.config.bib_domain_templates, TEMPLATES_DIR],
+                                          self.cache.root / BYTECODE_DIR if self.cache else None)
+        self.sharder = BibSharder.from_config(self.config)
 
     def build_stack(self) -> API.PairStack_p:
         """ Make the parse/write stack for bibtex """
+        import bibble as BM  # noqa: PLC0415
         stack = BM.PairStack()
         extra = BM.metadata.DataInsertMW()
         stack.add(read=[extra])
@@ -109,15 +161,213 @@ class BibtexParser(SphinxParser):
         stack.add(write=[extra])
         return stack
 
+    def shared_writer[W:BibJinjaWriter](self, writer_cls:type[W], template_dirs:list, bytecode_dir:Maybe[pl.Path]) -> W:
+        """ Get the process-wide writer for these templates, so they are only compiled once """
+        key = (type(self), writer_cls, *[str(x) for x in template_dirs], str(bytecode_dir))
+
+        def build() -> W:
+            writer = writer_cls(self._stack, templates=template_dirs, bytecode_dir=bytecode_dir)
+            writer.update_templates(self._templates)
+            return writer
+
+        return shared(key, build)
+
+    def build_cache(self) -> Maybe[BibCache]:
+        """ Make the on-disk cache of generated rst, if enabled.
+
+        Defaults to a hidden '.bib_cache' directory beside the doctrees,
+        so it survives a fresh environment (-E) and removing the doctrees.
+        Like '.doctrees', it is hidden when that is the output dir.
+        """
+        if not self.config.bib_domain_cache:
+            return None
+
+        match self.config.bib_domain_cache_dir:
+            case None:
+                root = pl.Path(self.env.doctreedir).parent / ".bib_cache"
+            case str() | pl.Path() as x:
+                root = pl.Path(self.env.srcdir) / x
+
+        return BibCache(root)
+
+    def cache_key(self, *parts:str) -> str:
+        """ Hash everything that determines the generated rst """
+        return BibCache.digest(*self.signature(), *parts)
+
+    def signature(self) -> list[str|bytes]:
+        """ The versions, stack and templates the generated rst depends on.
+        Computed once per process.
+        """
+        import bibble as BM  # noqa: PLC0415
+        from sphinx_bib_domain import __version__  # noqa: PLC0415
+        template_dirs = [self.config.bib_domain_templates, TEMPLATES_DIR]
+
+        def build() -> list[str|bytes]:
+            stack = [f"{type(x).__module__}.{type(x).__qualname__}"
+                     for x in [*self._stack.read_stack(), *self._stack.write_stack()]]
+            templates = []
+            for name in sorted(self._templates.values()):
+                for root in template_dirs:
+                    if (path:=pl.Path(root) / name).is_file():
+                        templates.append(path.read_bytes())
+                        break
+            else:
+                return [CACHE_VERSION, __version__, BM.__version__,
+                        type(self.writer).__qualname__, *stack, *templates]
+
+        return shared((type(self), "signature", type(self.writer), *map(str, template_dirs)), build)
+
     def parse(self, inputstring:str|StringList, document:nodes.document) -> None:
         """ Parse a bibtex file, generate equivalent rst, and parse that.
 
-        assigns the parsed bibtex library to document.raw_lib
+        The generated rst (and library, when needed) is cached on disk,
+        keyed by the content hash of the source.
+        On a miss, the rst of unchanged entries is reused from the last parse.
+        In direct mode, entries without rst markup are built straight into nodes instead.
+        A sharded library becomes a toctree of its shards.
+        With bib_domain_entries_to_context, the library is stored for bib_page_context.
+        The time taken is recorded in the domain, for scheduling the next parallel read.
         """
+        start = time.perf_counter()
+        self.parse_bib(inputstring, document)
+        self.env.get_domain(DOMAIN_NAME).note_parse_time(self.env.docname, time.perf_counter() - start)
+
+    def parse_bib(self, inputstring:str|StringList, document:nodes.document) -> None:
         doc_source  = pl.Path(document['source'])
-        lib         = self.reader.read(inputstring)
-        rst         = self.writer.write(lib, title=doc_source.stem)
-        # TODO use write_as_data
+        text        = inputstring if isinstance(inputstring, str) else "\n".join(inputstring)
+        to_context  = self.config.bib_domain_entries_to_context
+        if self.sharder is not None and not BibSharder.is_shard(doc_source):
+            match self.sharder.shards(text):
+                case dict() as shards if shards:
+                    from bibtexparser.library import Library  # noqa: PLC0415
+                    for key, labels in self.sharder.duplicates(shards).items():
+                        sphlog.warning("Duplicate key %s in shards: %s", key, ", ".join(labels),
+                                       location=self.env.docname)
+                    super().parse(self.shard_index(doc_source, list(shards)), document)
+                    if to_context:
+                        self.store_lib(Library())
+                    return
+                case _:
+                    pass
+
+        # One cache entry per document, overwritten when the source changes:
+        key         = BibCache.digest("rst", self.env.docname)
+        default     = self.env.current_document.default_domain
+        digest      = self.cache_key(doc_source.stem, text, default.name if default else "")
+        cached      = None
+        if self.cache is not None:
+            cached  = self.cache.get(key)
+
+        match cached:
+            case {"digest": str() as prior, "rst": str() as rst, "lib": lib, "entries": entries} if prior == digest and (lib is not None or not to_context):
+                pass
+            case _:
+                lib, fragments  = self.read(text)
+                rst             = self.write(lib, doc_source, fragments=fragments)
+                entries = getattr(self.writer, "entries", None)
+                if self.cache is not None:
+                    self.cache.put(key, {"digest": digest, "rst": rst, "lib": lib if to_context else None, "entries": entries})
+
         super().parse(rst, document)
-        if self.config.bib_domain_entries_to_context:
-            document.raw_lib = lib # type: ignore[attr-defined]
+        if entries is not None:
+            self.build_entries(entries, document)
+        if to_context:
+            self.store_lib(lib)
+
+    def read(self, text:str) -> tuple[Library, dict[str, list[str]]]:
+        """ Read bibtex into a library.
+
+        With bib_domain_parse_workers > 1, large files are split into chunks
+        of bib_domain_parse_chunk_size entries, which are read and rendered in a process pool.
+        Returns the library and any entry fragments rendered while reading.
+        """
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+        import bibble as BM  # noqa: PLC0415
+        from bibble.model import MetaBlock  # noqa: PLC0415
+        from bibtexparser.library import Library  # noqa: PLC0415
+        from sphinx_bib_domain.writer import FragmentCacheWriter  # noqa: PLC0415
+        workers  = self.config.bib_domain_parse_workers
+        chunks   = split_entries(text, self.config.bib_domain_parse_chunk_size)
+        if workers < 2 or len(chunks) < 2:
+            return self.reader.read(text), {}
+
+        render        = isinstance(self.writer, FragmentCacheWriter)
+        template_dirs = [self.config.bib_domain_templates, TEMPLATES_DIR]
+        lib           = Library()
+        fragments     = {}
+        meta          = None
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = pool.map(read_chunk,
+                               [x for _, x in chunks],
+                               [x for x, _ in chunks],
+                               itz.repeat(render),
+                               itz.repeat(template_dirs))
+            for chunk_lib, chunk_fragments in results:
+                lib.add([x for x in chunk_lib.blocks if not isinstance(x, MetaBlock)])
+                fragments.update(chunk_fragments)
+                meta = meta or MetaBlock.find_in(chunk_lib)
+
+        if meta is not None:
+            # Read transforms add their meta block after all other blocks
+            lib.add(meta)
+
+        for middleware in self._stack.read_stack():
+            if isinstance(middleware, BM.failure.DuplicateKeyHandler):
+                lib = middleware.transform(library=lib)
+        else:
+            return lib, fragments
+
+    def write(self, lib:Library, doc_source:pl.Path, *, fragments:Maybe[dict]=None) -> str:
+        """ Write the library as rst, reusing the cached fragments of the document """
+        from sphinx_bib_domain.writer import FragmentCacheWriter  # noqa: PLC0415
+        if not isinstance(self.writer, FragmentCacheWriter):
+            self.writer.resolves = EntryNodeBuilder(self.env, None).resolves
+            return self.writer.write(lib, title=doc_source.stem)
+
+        key                    = BibCache.digest("fragments", self.env.docname)
+        digest                 = self.cache_key()
+        self.writer.fragments  = dict(fragments or {})
+        match self.cache.get(key) if self.cache is not None else None:
+            case {"digest": str() as prior, "fragments": dict() as cached} if prior == digest:
+                self.writer.fragments.update(cached)
+            case _:
+                pass
+
+        rst                    = self.writer.write(lib, title=doc_source.stem)
+        if self.cache is not None:
+            self.cache.put(key, {"digest": digest, "fragments": self.writer.used})
+        self.writer.fragments  = {}
+        return rst
+
+    def store_lib(self, lib:Library) -> None:
+        """ Store the library of the current document beside the doctrees,
+        instead of pickling it into the doctree.
+        """
+        store = BibCache(pl.Path(self.env.doctreedir) / LIB_STORE_DIR)
+        store.put(BibCache.digest(self.env.docname), lib)
+
+    def shard_index(self, doc_source:pl.Path, labels:list[str]) -> str:
+        """ The rst of a sharded library: its header, and a toctree of the shards """
+        from bibtexparser.library import Library  # noqa: PLC0415
+        stem       = pl.PurePosixPath(self.env.docname).name
+        shard_dir  = BibSharder.shard_dir(pl.Path(), stem)
+        toctree    = [".. toctree::", "   :maxdepth: 1", ""]
+        toctree   += [f"   {shard_dir}/{BibSharder.shard_name(doc_source.stem, x)}" for x in labels]
+        lib        = Library()
+        return self.writer.make_lib(header=self.writer.make_header(lib, title=doc_source.stem),
+                                    body=["\n".join(toctree)],
+                                    footer=self.writer.make_footer(lib))
+
+    def build_entries(self, entries:list[tuple[str, dict[str, str]]], document:nodes.document) -> None:
+        """ Replace the placeholders of the direct mode with entry nodes """
+        from sphinx_bib_domain.writer import ENTRY_PLACEHOLDER  # noqa: PLC0415
+        builder = EntryNodeBuilder(self.env, document,
+                                   lean=self.config.bib_domain_lean,
+                                   compact=self.config.bib_domain_compact)
+        for comment in list(document.findall(nodes.comment)):
+            match comment.astext().split():
+                case [str() as x, str() as idx] if x == ENTRY_PLACEHOLDER:
+                    key, options = entries[int(idx)]
+                    comment.replace_self(builder.build(key, options))
+                case _:
+                    pass
@@ -8,17 +8,8 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
 import types
-import weakref
-from uuid import UUID, uuid1
 
 # ##-- end stdlib imports
 
@@ -0,0 +1,3 @@
+from .bib_cache import BibCache
+from .shards import BibSharder
+from .schedule import ReadScheduler
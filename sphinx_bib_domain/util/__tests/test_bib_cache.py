@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+
+
+"""
+# ruff: noqa: ANN201, ARG001, ANN001, ARG002, ANN202, B011
+
+# Imports
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+import pickle
+import warnings
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+# ##-- end 3rd party imports
+
+
+##--|
+from ..bib_cache import BibCache
+##--|
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+
+class TestBibCache:
+
+    def test_sanity(self):
+        assert(True is not False)
+
+    def test_digest_stable(self):
+        assert(BibCache.digest("a", b"b") == BibCache.digest("a", b"b"))
+
+    def test_digest_parts_separated(self):
+        assert(BibCache.digest("ab", "c") != BibCache.digest("a", "bc"))
+
+    def test_missing(self, tmp_path):
+        cache = BibCache(tmp_path / "cache")
+        assert(cache.get("blah") is None)
+
+    def test_roundtrip(self, tmp_path):
+        cache = BibCache(tmp_path / "cache")
+        key   = BibCache.digest("text")
+        cache.put(key, {"rst": "blah", "lib": None})
+        assert(cache.path(key).exists())
+        assert(cache.get(key) == {"rst": "blah", "lib": None})
+        assert(not list(cache.root.glob("*.tmp")))
+
+    @pytest.mark.parametrize("error", [TypeError, AttributeError, pickle.PicklingError])
+    def test_unpicklable_is_not_fatal(self, tmp_path, error):
+        class Unpicklable:
+            def __reduce__(self):
+                raise error("unpicklable")
+
+        cache = BibCache(tmp_path / "cache")
+        cache.put("bad", Unpicklable())
+        assert(cache.get("bad") is None)
+        assert(not list(cache.root.iterdir()))
+
+    def test_failed_replace_removes_tmp(self, tmp_path, mocker):
+        cache = BibCache(tmp_path / "cache")
+        mocker.patch("os.replace", side_effect=OSError("denied"))
+        cache.put("key", {"rst": "blah"})
+        assert(not list(cache.root.iterdir()))
+
+    def test_corrupt_entry_is_missing(self, tmp_path):
+        cache = BibCache(tmp_path)
+        cache.path("bad").write_bytes(b"not a pickle")
+        assert(cache.get("bad") is None)
+
+    ##--|
+    @pytest.mark.skip
+    def test_todo(self):
+        pass
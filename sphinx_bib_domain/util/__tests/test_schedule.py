@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+
+
+"""
+# ruff: noqa: ANN201, ARG001, ANN001, ARG002, ANN202, B011
+
+# Imports
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+import warnings
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+# ##-- end 3rd party imports
+
+
+##--|
+from sphinx.util.parallel import make_chunks
+from ..schedule import ReadScheduler
+##--|
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+DOCS : Final[list[str]] = [f"doc_{i:02}" for i in range(12)]
+# Body:
+
+class TestReadScheduler:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_serial_unchanged(self):
+        assert(ReadScheduler(1).order(DOCS, {"doc_11": 10.0}) == DOCS)
+
+    def test_unweighted_unchanged(self):
+        assert(ReadScheduler(3).order(DOCS, {}) == DOCS)
+
+    def test_keeps_docs(self):
+        weights = {"doc_03": 1.0, "doc_07": 5.0, "doc_11": 10.0}
+        result  = ReadScheduler(3).order(DOCS, weights)
+        assert(sorted(result) == DOCS)
+
+    def test_heaviest_first(self):
+        weights = {"doc_03": 1.0, "doc_07": 5.0, "doc_11": 10.0}
+        result  = ReadScheduler(3).order(DOCS, weights)
+        assert(result[0] == "doc_11")
+
+    def test_spreads_heavy_docs(self):
+        weights = {"doc_09": 8.0, "doc_10": 9.0, "doc_11": 10.0}
+        chunks  = make_chunks(ReadScheduler(3).order(DOCS, weights), 3)
+        assert(len(chunks) == 3)
+        assert(all(len([x for x in chunk if x in weights]) == 1 for chunk in chunks))
+
+    def test_short_chunk_stays_last(self):
+        docs    = DOCS[:7]
+        weights = {"doc_06": 10.0}
+        before  = [len(x) for x in make_chunks(docs, 3)]
+        result  = ReadScheduler(3).order(docs, weights)
+        assert([len(x) for x in make_chunks(result, 3)] == before)
+        assert(result[0] == "doc_06")
+
+    ##--|
+    @pytest.mark.skip
+    def test_todo(self):
+        pass
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+An on-disk cache for the results of parsing bibtex,
+keyed by content hashes so it survives cleaning the doctrees.
+
+"""
+# ruff: noqa:
+from __future__ import annotations
+# Imports:
+
+# ##-- stdlib imports
+import hashlib
+import logging as logmod
+import os
+import pathlib as pl
+import pickle
+import tempfile
+# ##-- end stdlib imports
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+SUFFIX : Final[str] = ".pickle"
+
+# Body:
+
+class BibCache:
+    """ A directory of pickled values, keyed by hex digests.
+
+    Writes are atomic (write to a temp file, then rename),
+    so parallel read workers can share the directory.
+    Unreadable entries are treated as missing.
+    """
+    _root : pl.Path
+
+    @staticmethod
+    def digest(*parts:str|bytes) -> str:
+        """ Hash the parts into a cache key """
+        hasher = hashlib.sha256()
+        for part in parts:
+            match part:
+                case str():
+                    hasher.update(part.encode())
+                case bytes():
+                    hasher.update(part)
+            hasher.update(b"\0")
+        else:
+            return hasher.hexdigest()
+
+    def __init__(self, root:pl.Path) -> None:
+        self._root = root
+
+    @property
+    def root(self) -> pl.Path:
+        return self._root
+
+    def path(self, key:str) -> pl.Path:
+        return self._root / f"{key}{SUFFIX}"
+
+    def get(self, key:str) -> Maybe[Any]:
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except Exception as err:  # noqa: BLE001
+            logging.info("Ignoring unreadable bib cache entry: %s : %s", path, err)
+            return None
+
+    def put(self, key:str, value:Any) -> None:
+        """ Store a value. Failing to is never fatal, and leaves no temp file behind """
+        tmp = None
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path(key))
+        except Exception as err:  # noqa: BLE001
+            logging.info("Failed to write bib cache entry: %s : %s", key, err)
+        finally:
+            if tmp is not None:
+                pl.Path(tmp).unlink(missing_ok=True)
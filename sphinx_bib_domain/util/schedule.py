@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Ordering documents for sphinx's parallel read.
+
+"""
+# ruff: noqa:
+from __future__ import annotations
+# Imports:
+
+# ##-- stdlib imports
+import itertools as itz
+import logging as logmod
+# ##-- end stdlib imports
+
+from sphinx.util.parallel import make_chunks
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+
+class ReadScheduler:
+    """ Orders docnames so sphinx's parallel read dispatches the heaviest work first.
+
+    Sphinx splits the docnames into contiguous chunks, one task each,
+    and hands them to nproc workers in order.
+    Weighted docs are spread over the chunks heaviest first, each into the
+    lightest chunk with room. Unweighted docs fill the remaining room,
+    and the chunks are ordered by their total weight.
+    Chunk sizes are kept, so sphinx's re-chunking of the result gives the same chunks.
+    """
+    _nproc : int
+
+    def __init__(self, nproc:int) -> None:
+        self._nproc = nproc
+
+    def order(self, docnames:Sequence[str], weights:Mapping[str, float]) -> list[str]:
+        chunks    : list[list[str]]
+        loads     : list[float]
+        sizes     : list[int]
+        if self._nproc < 2 or not any(x in weights for x in docnames):  # noqa: PLR2004
+            return list(docnames)
+
+        sizes     = [len(x) for x in make_chunks(list(docnames), self._nproc)]
+        chunks    = [[] for _ in sizes]
+        loads     = [0.0 for _ in sizes]
+        weighted  = sorted((x for x in docnames if x in weights), key=lambda x: weights[x], reverse=True)
+        for docname in weighted:
+            idx = min((i for i, x in enumerate(chunks) if len(x) < sizes[i]), key=lambda i: loads[i])
+            chunks[idx].append(docname)
+            loads[idx] += weights[docname]
+
+        rest = (x for x in docnames if x not in weights)
+        for idx, chunk in enumerate(chunks):
+            chunk.extend(itz.islice(rest, sizes[idx] - len(chunk)))
+        else:
+            # a short last chunk has to stay last, to keep sphinx's chunk boundaries:
+            ordered = sorted(range(len(chunks)), key=lambda i: (sizes[i] < sizes[0], -loads[i]))
+            return [x for i in ordered for x in chunks[i]]
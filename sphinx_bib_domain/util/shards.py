@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Splitting large bibtex libraries into multiple source documents.
+
+"""
+# ruff: noqa:
+from __future__ import annotations
+# Imports:
+
+# ##-- stdlib imports
+import collections
+import json
+import logging as logmod
+import pathlib as pl
+import re
+# ##-- end stdlib imports
+
+from sphinx.errors import ConfigError
+
+from .. import _interface as API
+from .bib_cache import BibCache
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+BLOCK_RE      : Final[re.Pattern]  = re.compile(r"@\s*(\w+)\s*[{(]\s*([^,\s]*)")
+YEAR_FIELD_RE : Final[re.Pattern]  = re.compile(r"^\s*year\s*=\s*[{\"]?\s*(\d{1,4})", re.MULTILINE | re.IGNORECASE)
+SHARED_BLOCKS : Final[frozenset]   = frozenset(["string", "preamble"])
+MARKER        : Final[str]         = ".bib_shards"
+UNKNOWN       : Final[str]         = "unknown"
+# The private attributes of sphinx.project.Project that shards are registered in:
+PROJECT_MAPS  : Final[tuple[str, ...]] = ("_docname_to_path", "_path_to_docname")
+# Body:
+
+class BibSharder:
+    """ Splits the text of a library into shards,
+    by first letter of key, year, or a fixed count of entries.
+
+    @string and @preamble blocks are copied into every shard.
+    Shards are written as .bib files in '{docname}_shards/', under a root in the build dir,
+    and registered with the sphinx project as documents.
+    The original document becomes a toctree of them.
+    """
+    _by      : str|int
+    _minimum : int
+
+    @staticmethod
+    def shard_dir(root:pl.Path, docname:str) -> pl.Path:
+        return root / f"{docname}{API.SHARD_DIR_SUFFIX}"
+
+    @staticmethod
+    def is_shard(source:pl.Path) -> bool:
+        """ Only directories with a marker hold generated shards """
+        return (source.parent / MARKER).is_file()
+
+    @staticmethod
+    def shard_name(stem:str, label:str) -> str:
+        return f"{stem}-{label}"
+
+    @staticmethod
+    def register(env:Any, docname:str, path:pl.Path) -> bool:
+        """ Add a shard to the documents of the sphinx project, at its absolute path.
+
+        Sphinx rediscovers the project each build, so this is done every build.
+        Returns False if a real document already has the docname.
+
+        Sphinx has no api to add documents outside the source dir,
+        so this writes the private docname/path maps of sphinx.project.Project,
+        as of sphinx 8.2. Raises a ConfigError if they are missing.
+        """
+        project = env.project
+        if not all(hasattr(project, x) for x in PROJECT_MAPS):
+            msg = ("bib_domain_shard_by needs the private document maps of sphinx.project.Project (%s), "
+                   "which this version of sphinx doesn't have. Unset bib_domain_shard_by to build.")
+            raise ConfigError(msg % ", ".join(PROJECT_MAPS))
+
+        match project._docname_to_path.get(docname):
+            case None:
+                pass
+            case x if x == path:
+                return True
+            case _:
+                return False
+
+        project.docnames.add(docname)
+        project._docname_to_path[docname] = path
+        project._path_to_docname[path] = docname
+        return True
+
+    @classmethod
+    def from_config(cls, config:Any) -> Maybe[Self]:
+        match config.bib_domain_shard_by:
+            case None:
+                return None
+            case "letter" | "year" as x:
+                return cls(x, minimum=config.bib_domain_shard_min)
+            case int() as x if 0 < x:
+                return cls(x, minimum=config.bib_domain_shard_min)
+            case str() as x if x.isdigit() and 0 < int(x):
+                return cls(int(x), minimum=config.bib_domain_shard_min)
+            case x:
+                msg = "bib_domain_shard_by must be None, 'letter', 'year', or a positive int"
+                raise ConfigError(msg, x)
+
+    @classmethod
+    def marker(cls, target:pl.Path) -> dict:
+        """ The record of the last write, or an empty dict """
+        try:
+            return json.loads((target / MARKER).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def clean(cls, target:pl.Path) -> None:
+        """ Remove generated shards, only if the directory is marked as generated """
+        if not (target / MARKER).exists():
+            return
+
+        for path in target.glob("*.bib"):
+            path.unlink()
+        else:
+            (target / MARKER).unlink()
+
+        if not any(target.iterdir()):
+            target.rmdir()
+
+    def __init__(self, by:str|int, *, minimum:int=0) -> None:
+        self._by       = by
+        self._minimum  = minimum
+
+    def shards(self, text:str) -> dict[str, str]:
+        """ Map shard labels to their text, in order.
+        Libraries of 'minimum' entries or fewer are not sharded.
+        """
+        shared  = []
+        groups  = collections.defaultdict(list)
+        count   = 0
+        for found, block in self._blocks(text):
+            match found:
+                case x if x[1].lower() in SHARED_BLOCKS:
+                    shared.append(block)
+                case x if x[1].lower() == "comment":
+                    pass
+                case x:
+                    groups[self.label(x[2], block, count)].append(block)
+                    count += 1
+
+        if count <= self._minimum:
+            return {}
+
+        return {label : "".join([*shared, *groups[label]]) for label in sorted(groups, key=self._sort_key)}
+
+    def duplicates(self, shards:dict[str, str]) -> dict[str, list[str]]:
+        """ Map keys found in more than one shard to the labels of those shards.
+        Duplicates within a shard are handled when it is read.
+        """
+        seen = collections.defaultdict(list)
+        for label, text in shards.items():
+            for found, _ in self._blocks(text):
+                match found:
+                    case x if x[1].lower() in {*SHARED_BLOCKS, "comment"}:
+                        pass
+                    case x if label not in seen[x[2]]:
+                        seen[x[2]].append(label)
+                    case _:
+                        pass
+        else:
+            return {key : labels for key, labels in seen.items() if 1 < len(labels)}
+
+    def label(self, key:str, block:str, index:int) -> str:
+        match self._by:
+            case "letter" if key[:1].isalnum():
+                return key[0].upper()
+            case "letter":
+                return "_"
+            case "year":
+                match YEAR_FIELD_RE.search(block):
+                    case None:
+                        return UNKNOWN
+                    case x:
+                        return x[1]
+            case int() as size:
+                return f"{index // size + 1:03}"
+            case x:
+                raise ValueError("Unknown shard type", x)
+
+    def write(self, source:pl.Path, target:pl.Path) -> list[pl.Path]:
+        """ Write the shards of a .bib file into the target dir, if it is large enough.
+
+        The marker records the source's size, mtime and digest, and the shards written.
+        A source with the same stat is not re-read, and one with the same digest is not re-split.
+        Otherwise, only changed shards are rewritten, so unchanged ones are not re-read.
+        Stale shards are removed.
+        """
+        stat     = source.stat()
+        stamp    = [stat.st_size, stat.st_mtime_ns, str(self._by), self._minimum]
+        marker   = self.marker(target)
+        previous = [target / x for x in marker.get("shards", [])]
+        match marker:
+            case {"stamp": list() as x} if x == stamp and all(y.exists() for y in previous):
+                return previous
+            case _:
+                pass
+
+        text     = source.read_text()
+        digest   = BibCache.digest(text, str(self._by), str(self._minimum))
+        match marker:
+            case {"digest": str() as x} if x == digest and all(y.exists() for y in previous):
+                self._mark(target, stamp, digest, previous)
+                return previous
+            case _:
+                pass
+
+        shards  = self.shards(text)
+        if not shards:
+            self.clean(target)
+            return []
+
+        target.mkdir(parents=True, exist_ok=True)
+        written = []
+        for label, shard in shards.items():
+            path = target / f"{self.shard_name(source.stem, label)}.bib"
+            written.append(path)
+            if not path.exists() or path.read_text() != shard:
+                path.write_text(shard)
+        else:
+            for stale in set(target.glob("*.bib")) - set(written):
+                stale.unlink()
+            self._mark(target, stamp, digest, written)
+            return written
+
+    def _blocks(self, text:str) -> Iterator[tuple[re.Match, str]]:
+        """ The @ blocks of bibtex text, and their type and key """
+        starts  = [x.start() for x in API.ENTRY_START_RE.finditer(text)]
+        for start, end in zip(starts, [*starts[1:], len(text)], strict=True):
+            block = text[start:end]
+            match BLOCK_RE.match(block):
+                case None:
+                    pass
+                case x:
+                    yield x, block
+
+    def _mark(self, target:pl.Path, stamp:list, digest:str, written:list[pl.Path]) -> None:
+        record = {"stamp": stamp, "digest": digest, "shards": [x.name for x in written]}
+        (target / MARKER).write_text(json.dumps(record))
+
+    def _sort_key(self, label:str) -> tuple:
+        match label:
+            case x if x.isdigit():
+                return (0, int(x), x)
+            case x:
+                return (1, 0, x)
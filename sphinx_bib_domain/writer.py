@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+The bibble writers BibtexParser uses to generate rst.
+Imported lazily, as bibble and jinja are slow to import.
+
+"""
+# ruff: noqa:
+from __future__ import annotations
+# Imports:
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+# ##-- end stdlib imports
+
+import jinja2
+from bibble.io import JinjaWriter
+from sphinx_bib_domain.directives import EntryNodeBuilder
+from sphinx_bib_domain.util import BibCache
+
+# ##-- types
+# isort: off
+# General
+import abc
+import collections.abc
+import typing
+import types
+from typing import cast, assert_type, assert_never
+from typing import Generic, NewType, Never
+from typing import no_type_check, final, override, overload
+# Protocols and Interfaces:
+from typing import Protocol, runtime_checkable
+# isort: on
+# ##-- end types
+
+# ##-- type checking
+# isort: off
+if typing.TYPE_CHECKING:
+    from typing import Final, ClassVar, Any, Self
+    from typing import Literal, LiteralString
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from jgdv import Maybe
+    from bibtexparser import model
+    from bibtexparser.library import Library
+## isort: on
+# ##-- end type checking
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+ENTRY_PLACEHOLDER  : Final[str]            = "bib_domain-entry"
+# The fields entry.rst.jinja passes to bibtex:entry
+ENTRY_FIELDS       : Final[frozenset[str]] = frozenset(["author", "editor", "doi", "title", "subtitle",
+                                                        "institution", "journal", "publisher", "series",
+                                                        "tags", "year", "url", "number", "volume",
+                                                        "edition", "edition_year", "isbn", "identifier"])
+# Body:
+
+class BibJinjaWriter(JinjaWriter):
+    """ A JinjaWriter which can keep compiled templates in a bytecode cache """
+    _bytecode_dir : Maybe[pl.Path]
+
+    def __init__(self, *args, bytecode_dir:Maybe[pl.Path]=None, **kwargs) -> None:
+        # set before super, as JinjaWriter.__init__ loads the default templates
+        self._bytecode_dir = bytecode_dir
+        super().__init__(*args, **kwargs)
+
+    @override
+    def update_templates(self, templates:dict[str, Maybe[str]]) -> None:
+        if self._bytecode_dir is not None and self._env.bytecode_cache is None:
+            self._bytecode_dir.mkdir(parents=True, exist_ok=True)
+            self._env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(self._bytecode_dir))
+
+        super().update_templates(templates)
+
+class FragmentCacheWriter(BibJinjaWriter):
+    """ A JinjaWriter which reuses rendered entries.
+
+    'fragments' maps entry hashes to previously rendered rst,
+    'used' collects the fragments of the last write,
+    to be stored for the next.
+    """
+    fragments : dict[str, list[str]]
+    used      : dict[str, list[str]]
+
+    @staticmethod
+    def entry_hash(block:model.Entry) -> str:
+        fields = [f"{k}={v.value!r}" for k, v in block.fields_dict.items()]
+        return BibCache.digest(block.entry_type, block.key, *fields)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.fragments  = {}
+        self.used       = {}
+
+    @override
+    def write(self, library:Library, **kwargs) -> str:
+        self.used = {}
+        return super().write(library, **kwargs)
+
+    @override
+    def visit_entry(self, block:model.Entry) -> list[str]:
+        key = self.entry_hash(block)
+        match self.fragments.get(key, None):
+            case None:
+                result = super().visit_entry(block)
+            case [*xs]:
+                result = xs
+
+        self.used[key] = result
+        return result
+
+class EntryDataWriter(BibJinjaWriter):
+    """ A JinjaWriter for the direct mode of BibtexParser.
+
+    Entries are written as placeholder comments,
+    and their directive options collected in 'entries',
+    to be built into nodes without parsing rst.
+    Entries with markup only the rst parser handles,
+    or roles 'resolves' rejects, are rendered
+    with the entry template, as bibtex:entry directives.
+    """
+    entries  : list[tuple[str, dict[str, str]]]
+    resolves : Callable[[Mapping[str, str]], bool]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.entries  = []
+        self.resolves = lambda options: True
+
+    @override
+    def write(self, library:Library, **kwargs) -> str:
+        self.entries = []
+        return super().write(library, **kwargs)
+
+    @override
+    def visit_entry(self, block:model.Entry) -> list[str]:
+        options = self.entry_options(block)
+        if not (EntryNodeBuilder.is_plain(options) and self.resolves(options)):
+            return super().visit_entry(block)
+
+        self.entries.append((block.key, options))
+        return [f"\n.. {ENTRY_PLACEHOLDER} {len(self.entries) - 1}\n"]
+
+    @staticmethod
+    def entry_options(block:model.Entry) -> dict[str, str]:
+        """ The equivalent of the fields entry.rst.jinja generates """
+        options = {}
+        for key, field in block.fields_dict.items():
+            match key, field.value:
+                case "author" | "editor", [*xs]:
+                    options[key] = " | ".join(str(x) for x in xs).strip()
+                case str() as k, val if k in ENTRY_FIELDS and val != "":
+                    options[key] = str(val).strip()
+                case _:
+                    pass
+        else:
+            return options